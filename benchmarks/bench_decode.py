@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark decoding of transaction pages.
+
+Compares, for one page of fake API transactions converted to the
+integration's compact records:
+
+- whole: the body decoded in one call, then every element converted
+  (what the coordinator does for bodies under STREAM_MIN_BYTES)
+- streamed: the body fed in chunks to JSONArrayParser, each element
+  converted as soon as it is decoded (what it does for larger bodies)
+
+each with Home Assistant's json_loads (orjson) and the stdlib json module.
+Reports the median CPU time per page and the peak memory allocated while
+decoding it.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.bench_decode
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from homeassistant.util.json import json_loads
+
+from custom_components.pocketsmith.coordinator import (
+    STREAM_CHUNK_SIZE,
+    STREAM_MIN_BYTES,
+    TRANSACTIONS_PAGE_SIZE,
+    _parse_transaction,
+)
+from custom_components.pocketsmith.json_stream import JSONArrayParser
+
+from .fake_api import FakeAPIConfig, FakePocketSmithAPI
+
+DECODERS: dict[str, Callable[[bytes], Any]] = {
+    "default": json_loads,
+    "stdlib": json.loads,
+}
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transactions",
+        type=int,
+        default=TRANSACTIONS_PAGE_SIZE,
+        help="transactions in the page (default: a full page)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=STREAM_CHUNK_SIZE, help="bytes per streamed chunk"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per variant")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    return parser.parse_args(argv)
+
+
+def _whole(body: bytes, chunk_size: int, loads: Callable[[bytes], Any]) -> list[Any]:
+    """Decode the body at once, then convert every element."""
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    page = loads(b"".join(chunks))
+    return [t for t in map(_parse_transaction, page) if t is not None]
+
+
+def _streamed(body: bytes, chunk_size: int, loads: Callable[[bytes], Any]) -> list[Any]:
+    """Decode and convert the elements as the chunks arrive."""
+    parser = JSONArrayParser(loads)
+    records = []
+    for start in range(0, len(body), chunk_size):
+        for element in parser.feed(body[start : start + chunk_size]):
+            if (record := _parse_transaction(element)) is not None:
+                records.append(record)
+    for element in parser.close():
+        if (record := _parse_transaction(element)) is not None:
+            records.append(record)
+    return records
+
+
+STRATEGIES = {"whole": _whole, "streamed": _streamed}
+
+
+def _measure(
+    strategy: Callable[..., list[Any]],
+    body: bytes,
+    chunk_size: int,
+    loads: Callable[[bytes], Any],
+    repeat: int,
+) -> dict[str, float]:
+    """Return the median CPU milliseconds and the peak KiB allocated."""
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        strategy(body, chunk_size, loads)
+        timings.append((time.process_time() - start) * 1000)
+
+    tracemalloc.start()
+    strategy(body, chunk_size, loads)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"cpu_ms": statistics.median(timings), "peak_kib": peak / 1024}
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark and return its results."""
+    api = FakePocketSmithAPI(
+        FakeAPIConfig(accounts=1, transactions_per_account=args.transactions)
+    )
+    page = next(iter(api.transactions.values()))
+    body = json.dumps(page).encode()
+
+    expected = _whole(body, args.chunk_size, json.loads)
+    results: dict[str, Any] = {"body_bytes": len(body), "variants": {}}
+    for strategy_name, strategy in STRATEGIES.items():
+        for decoder_name, loads in DECODERS.items():
+            if strategy(body, args.chunk_size, loads) != expected:
+                raise RuntimeError("{} / {} decoded differently".format(strategy_name, decoder_name))
+            results["variants"]["{}/{}".format(strategy_name, decoder_name)] = _measure(
+                strategy, body, args.chunk_size, loads, args.repeat
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line."""
+    args = _parse_args(argv)
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print("Page of {} transactions, {} bytes, decoded {} by the coordinator".format(
+        args.transactions,
+        results["body_bytes"],
+        "streamed" if results["body_bytes"] >= STREAM_MIN_BYTES else "whole",
+    ))
+    for name, metrics in results["variants"].items():
+        print("{:18s} {:8.2f} ms CPU  {:10.0f} KiB peak".format(
+            name, metrics["cpu_ms"], metrics["peak_kib"]
+        ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
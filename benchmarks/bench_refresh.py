@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Benchmark PocketSmithDataUpdateCoordinator refreshes against the fake API.
+
+Runs a cold refresh followed by warm refreshes (with a few accounts touched
+in between) and reports, per refresh, the wall time, the number of requests,
+the response statuses and the bytes decoded. It then times building the
+sensor states and attributes for every entity.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.bench_refresh --accounts 25 --transactions 500
+
+Use --save to record a baseline and --baseline to compare against one; the
+script exits non-zero when a metric regresses beyond the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import timedelta
+import json
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+from custom_components.pocketsmith import sensor
+from custom_components.pocketsmith.const import DOMAIN
+from custom_components.pocketsmith.coordinator import PocketSmithDataUpdateCoordinator
+
+from .fake_api import FakeAPIConfig, FakePocketSmithAPI
+
+# Metrics compared against a baseline, and whether they are timings (which
+# get the relative tolerance) or counts (which must not increase)
+TIMED_METRICS = ("cold_refresh_s", "warm_refresh_s", "attributes_ms")
+COUNTED_METRICS = ("cold_requests", "warm_requests", "cold_bytes", "warm_bytes")
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=10, help="transaction accounts")
+    parser.add_argument(
+        "--transactions", type=int, default=200, help="transactions per account"
+    )
+    parser.add_argument(
+        "--transactions-per-account",
+        type=int,
+        default=20,
+        help="coordinator transactions_per_account setting",
+    )
+    parser.add_argument("--concurrency", type=int, default=5, help="fetch concurrency")
+    parser.add_argument(
+        "--json-decoder",
+        choices=("default", "stdlib"),
+        default="default",
+        help="decode responses with Home Assistant's json_loads or the stdlib json module",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=50.0, help="milliseconds added to every response"
+    )
+    parser.add_argument(
+        "--not-found", type=int, default=0, help="accounts whose transactions return 404"
+    )
+    parser.add_argument(
+        "--rate-limit-every", type=int, default=0, help="return 429 for every Nth request"
+    )
+    parser.add_argument(
+        "--retry-after", type=int, default=0, help="Retry-After seconds sent with 429s"
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="warm refreshes to run")
+    parser.add_argument(
+        "--touch", type=int, default=2, help="accounts updated before each warm refresh"
+    )
+    parser.add_argument(
+        "--attribute-passes", type=int, default=50, help="passes over all entities"
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--save", metavar="FILE", help="write results to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against FILE")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown of timings against the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def _stats_delta(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Return the server counters accumulated between two snapshots."""
+    statuses = {
+        status: count - before["statuses"].get(status, 0)
+        for status, count in after["statuses"].items()
+        if count - before["statuses"].get(status, 0)
+    }
+    return {
+        "requests": after["requests"] - before["requests"],
+        "bytes": after["bytes_sent"] - before["bytes_sent"],
+        "statuses": statuses,
+    }
+
+
+async def _timed_refresh(
+    coordinator: PocketSmithDataUpdateCoordinator, api: FakePocketSmithAPI
+) -> dict[str, Any]:
+    """Run one refresh and return its wall time and request counters."""
+    before = api.stats.as_dict()
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    elapsed = time.perf_counter() - start
+    if not coordinator.last_update_success:
+        raise RuntimeError("Refresh failed: {}".format(coordinator.last_exception))
+    return {"wall_s": elapsed, **_stats_delta(before, api.stats.as_dict())}
+
+
+async def _build_entities(
+    hass: HomeAssistant, coordinator: PocketSmithDataUpdateCoordinator
+) -> list[Any]:
+    """Create the sensor entities the platform would add for this data."""
+    entities: list[Any] = []
+    hass.data.setdefault(DOMAIN, {})[coordinator.entry_id] = coordinator
+    entry = SimpleNamespace(entry_id=coordinator.entry_id, async_on_unload=lambda _: None)
+    await sensor.async_setup_entry(hass, entry, entities.extend)
+    return entities
+
+
+def _time_attributes(entities: list[Any], passes: int) -> float:
+    """Return the median milliseconds to read every entity's state and attributes."""
+    timings = []
+    for _ in range(passes):
+        start = time.perf_counter()
+        for entity in entities:
+            entity.native_value  # pylint: disable=pointless-statement
+            entity.icon  # pylint: disable=pointless-statement
+            entity.extra_state_attributes  # pylint: disable=pointless-statement
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark and return its results."""
+    api = FakePocketSmithAPI(
+        FakeAPIConfig(
+            accounts=args.accounts,
+            transactions_per_account=args.transactions,
+            latency=args.latency / 1000,
+            not_found_accounts=args.not_found,
+            rate_limit_every=args.rate_limit_every,
+            retry_after=args.retry_after,
+        )
+    )
+    base_url = await api.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            async with aiohttp.ClientSession() as session:
+                coordinator = PocketSmithDataUpdateCoordinator(
+                    hass,
+                    session=session,
+                    api_key="benchmark",
+                    update_interval=timedelta(minutes=5),
+                    entry_id="benchmark",
+                    username="benchmark",
+                    fetch_concurrency=args.concurrency,
+                    transactions_per_account=args.transactions_per_account,
+                    user_id=api.config.user_id,
+                    base_url=base_url,
+                    **({"json_decoder": json.loads} if args.json_decoder == "stdlib" else {}),
+                )
+
+                cold = await _timed_refresh(coordinator, api)
+                warm = []
+                for _ in range(args.rounds):
+                    api.touch(args.touch)
+                    warm.append(await _timed_refresh(coordinator, api))
+
+                entities = await _build_entities(hass, coordinator)
+                attributes_ms = _time_attributes(entities, args.attribute_passes)
+        finally:
+            await api.stop()
+            await hass.async_stop(force=True)
+
+    return {
+        "parameters": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("json", "save", "baseline", "tolerance")
+        },
+        "cold_refresh_s": cold["wall_s"],
+        "cold_requests": cold["requests"],
+        "cold_bytes": cold["bytes"],
+        "cold_statuses": cold["statuses"],
+        "warm_refresh_s": statistics.median(r["wall_s"] for r in warm) if warm else 0.0,
+        "warm_requests": max((r["requests"] for r in warm), default=0),
+        "warm_bytes": max((r["bytes"] for r in warm), default=0),
+        "warm_statuses": warm[-1]["statuses"] if warm else {},
+        "entities": len(entities),
+        "attributes_ms": attributes_ms,
+    }
+
+
+def _compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return a description of every metric that regressed against the baseline."""
+    regressions = []
+    for metric in TIMED_METRICS:
+        if metric in baseline and results[metric] > baseline[metric] * (1 + tolerance):
+            regressions.append(
+                "{}: {:.4f} > {:.4f} (+{:.0%} allowed)".format(
+                    metric, results[metric], baseline[metric], tolerance
+                )
+            )
+    for metric in COUNTED_METRICS:
+        if metric in baseline and results[metric] > baseline[metric]:
+            regressions.append(
+                "{}: {} > {}".format(metric, results[metric], baseline[metric])
+            )
+    return regressions
+
+
+def _print_report(results: dict[str, Any]) -> None:
+    """Print a human readable summary."""
+    print("Cold refresh:  {:8.3f} s  {:5d} requests  {:10d} bytes  {}".format(
+        results["cold_refresh_s"],
+        results["cold_requests"],
+        results["cold_bytes"],
+        results["cold_statuses"],
+    ))
+    print("Warm refresh:  {:8.3f} s  {:5d} requests  {:10d} bytes  {}  (median / max)".format(
+        results["warm_refresh_s"],
+        results["warm_requests"],
+        results["warm_bytes"],
+        results["warm_statuses"],
+    ))
+    print("Attributes:    {:8.3f} ms for {} entities (median pass)".format(
+        results["attributes_ms"], results["entities"]
+    ))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line."""
+    args = _parse_args(argv)
+    results = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_report(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("parameters") != results["parameters"]:
+            print("Warning: baseline was recorded with different parameters", file=sys.stderr)
+        regressions = _compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions against {}:".format(args.baseline), file=sys.stderr)
+            for regression in regressions:
+                print("  " + regression, file=sys.stderr)
+            return 1
+        print("No regressions against {}".format(args.baseline))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""Local stand-in for the PocketSmith /v2 endpoints used by the coordinator.
+
+The server generates a deterministic set of accounts and transactions and
+serves them with the same shape, pagination headers (Link, Total, Per-Page)
+and conditional request handling (ETag / If-None-Match) as the real API.
+Latency, 404s for selected transaction accounts and periodic 429s can be
+injected to exercise the coordinator's error handling.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+import hashlib
+import json
+import random
+from typing import Any
+
+from aiohttp import web
+
+PAYEES = [
+    "Tesco",
+    "Sainsbury's",
+    "Amazon",
+    "Shell",
+    "Netflix",
+    "Council Tax",
+    "Salary",
+    "Pret A Manger",
+    "Trainline",
+    "British Gas",
+]
+
+# Leaf categories assigned to transactions; parent_id refers to PARENT_CATEGORIES
+CATEGORIES = [
+    {"id": 1001, "title": "Groceries", "colour": "#7cb342", "parent_id": 1000},
+    {"id": 1002, "title": "Transport", "colour": "#039be5", "parent_id": None},
+    {"id": 1003, "title": "Bills", "colour": "#e53935", "parent_id": None},
+    {"id": 1004, "title": "Eating Out", "colour": "#fb8c00", "parent_id": 1000},
+    {"id": 1005, "title": "Income", "colour": "#43a047", "parent_id": None},
+]
+PARENT_CATEGORIES = [
+    {"id": 1000, "title": "Food", "colour": "#8d6e63", "parent_id": None},
+]
+
+
+def _isoformat(value: datetime) -> str:
+    """Format a UTC datetime the way the PocketSmith API does."""
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class FakeAPIConfig:
+    """Shape of the generated data and the faults to inject."""
+
+    accounts: int = 10
+    transactions_per_account: int = 200
+    feed_ratio: float = 0.5
+    uncategorized_ratio: float = 0.1
+    # Seconds added before every response
+    latency: float = 0.0
+    # Number of transaction accounts whose transactions return 404
+    not_found_accounts: int = 0
+    # Return 429 for every Nth request (0 disables)
+    rate_limit_every: int = 0
+    retry_after: int = 0
+    user_id: int = 1
+    seed: int = 1
+
+
+@dataclass
+class FakeAPIStats:
+    """Counters for everything the server sent."""
+
+    requests: int = 0
+    bytes_sent: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    endpoints: Counter = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as plain JSON-serialisable values."""
+        return {
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "endpoints": dict(sorted(self.endpoints.items())),
+        }
+
+
+class FakePocketSmithAPI:
+    """aiohttp application serving generated PocketSmith data."""
+
+    def __init__(self, config: FakeAPIConfig | None = None) -> None:
+        """Generate the data set."""
+        self.config = config or FakeAPIConfig()
+        self.stats = FakeAPIStats()
+        self._random = random.Random(self.config.seed)
+        self._now = datetime(2026, 1, 31, 12, 0, tzinfo=timezone.utc)
+        self._next_transaction_id = 1
+        self.accounts: list[dict[str, Any]] = []
+        self.transaction_accounts: list[dict[str, Any]] = []
+        self.transactions: dict[int, list[dict[str, Any]]] = {}
+        self.not_found: set[int] = set()
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+        self._generate()
+
+    def _generate(self) -> None:
+        """Create the accounts, transaction accounts and transactions."""
+        config = self.config
+        for index in range(config.accounts):
+            account_id = 100 + index
+            ta_id = 500 + index
+            is_feed = self._random.random() < config.feed_ratio
+            institution = {"id": 900 + index % 4, "title": "Bank {}".format(index % 4)}
+            transaction_account = {
+                "id": ta_id,
+                "account_id": account_id,
+                "name": "Account {}".format(index),
+                "number": "{:08d}".format(ta_id),
+                "type": "bank",
+                "currency_code": "gbp",
+                "current_balance": round(self._random.uniform(-500, 5000), 2),
+                "current_balance_in_base_currency": 0.0,
+                "current_balance_date": self._now.date().isoformat(),
+                "starting_balance": 0.0,
+                "offline": not is_feed,
+                "data_feeds_connection_id": 7000 + index if is_feed else None,
+                "latest_feed_name": "Bank {} feed".format(index % 4) if is_feed else None,
+                "institution": institution,
+                "created_at": _isoformat(self._now - timedelta(days=365)),
+                "updated_at": _isoformat(self._now - timedelta(hours=index % 30)),
+            }
+            transaction_account["current_balance_in_base_currency"] = transaction_account[
+                "current_balance"
+            ]
+            self.transaction_accounts.append(transaction_account)
+            self.accounts.append(
+                {
+                    "id": account_id,
+                    "title": transaction_account["name"],
+                    "type": "bank",
+                    "currency_code": "gbp",
+                    "current_balance": transaction_account["current_balance"],
+                    "transaction_accounts": [transaction_account],
+                    "created_at": transaction_account["created_at"],
+                    "updated_at": transaction_account["updated_at"],
+                }
+            )
+            self.transactions[ta_id] = [
+                self._make_transaction(transaction_account, day)
+                for day in range(config.transactions_per_account)
+            ]
+            if index < config.not_found_accounts:
+                self.not_found.add(ta_id)
+
+    def _make_transaction(
+        self, transaction_account: dict[str, Any], days_ago: int
+    ) -> dict[str, Any]:
+        """Return one transaction with the nested objects the API embeds."""
+        transaction_id = self._next_transaction_id
+        self._next_transaction_id += 1
+        category = None
+        if self._random.random() >= self.config.uncategorized_ratio:
+            category = dict(self._random.choice(CATEGORIES))
+        amount = round(self._random.uniform(-150, 50), 2)
+        return {
+            "id": transaction_id,
+            "payee": self._random.choice(PAYEES),
+            "original_payee": "CARD PAYMENT {}".format(transaction_id),
+            "date": (date(2026, 1, 31) - timedelta(days=days_ago // 3)).isoformat(),
+            "upload_source": "data_feed",
+            "category": category,
+            "closing_balance": 0.0,
+            "cheque_number": None,
+            "memo": None,
+            "amount": amount,
+            "amount_in_base_currency": amount,
+            "type": "debit" if amount < 0 else "credit",
+            "is_transfer": False,
+            "needs_review": False,
+            "status": "posted",
+            "note": None,
+            "labels": [],
+            "transaction_account": transaction_account,
+            "created_at": _isoformat(self._now - timedelta(days=days_ago // 3)),
+            "updated_at": _isoformat(self._now - timedelta(days=days_ago // 3)),
+        }
+
+    def touch(self, accounts: int, new_transactions: int = 1) -> None:
+        """Simulate a feed update on the first N accounts.
+
+        Each touched account gets new transactions and a later updated_at, so
+        the next refresh has something to sync.
+        """
+        self._now += timedelta(minutes=5)
+        for transaction_account in self.transaction_accounts[:accounts]:
+            transaction_account["updated_at"] = _isoformat(self._now)
+            transaction_account["current_balance"] = round(
+                transaction_account["current_balance"] + 1, 2
+            )
+            new = [
+                self._make_transaction(transaction_account, 0)
+                for _ in range(new_transactions)
+            ]
+            for transaction in new:
+                transaction["updated_at"] = _isoformat(self._now)
+            self.transactions[transaction_account["id"]][:0] = new
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/v2/me", self._handle_me)
+        app.router.add_get("/v2/users/{user_id}/accounts", self._handle_accounts)
+        app.router.add_get(
+            "/v2/users/{user_id}/transaction_accounts", self._handle_transaction_accounts
+        )
+        app.router.add_get("/v2/users/{user_id}/categories", self._handle_categories)
+        app.router.add_get(
+            "/v2/transaction_accounts/{ta_id}/transactions", self._handle_transactions
+        )
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the /v2 base URL."""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # pylint: disable=protected-access
+        port = sockets[0].getsockname()[1]
+        self.base_url = "http://{}:{}/v2".format(host, port)
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Apply latency and rate limiting, and record statistics."""
+        self.stats.requests += 1
+        route = request.match_info.route.resource
+        self.stats.endpoints[route.canonical if route else request.path] += 1
+
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+        if self.config.rate_limit_every and self.stats.requests % self.config.rate_limit_every == 0:
+            response = web.json_response(
+                {"error": "Too many requests"},
+                status=429,
+                headers={"Retry-After": str(self.config.retry_after)},
+            )
+        else:
+            response = await handler(request)
+
+        self.stats.statuses[response.status] += 1
+        if response.body is not None:
+            self.stats.bytes_sent += len(response.body)
+        return response
+
+    def _wrong_user(self, request: web.Request) -> web.Response | None:
+        """Return a 403 response for a user id other than the configured one."""
+        if int(request.match_info["user_id"]) != self.config.user_id:
+            return web.json_response({"error": "Forbidden"}, status=403)
+        return None
+
+    @staticmethod
+    def _respond(
+        request: web.Request, body: Any, headers: dict[str, str] | None = None
+    ) -> web.Response:
+        """Serialise a body, answering 304 if the client's ETag matches."""
+        payload = json.dumps(body).encode()
+        etag = '"{}"'.format(hashlib.sha1(payload).hexdigest())
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=payload,
+            content_type="application/json",
+            headers={"ETag": etag, **(headers or {})},
+        )
+
+    async def _handle_me(self, request: web.Request) -> web.Response:
+        """Serve /me."""
+        return self._respond(
+            request,
+            {
+                "id": self.config.user_id,
+                "login": "benchmark",
+                "name": "Benchmark User",
+                "email": "benchmark@example.com",
+                "base_currency_code": "gbp",
+                "time_zone": "London",
+            },
+        )
+
+    async def _handle_accounts(self, request: web.Request) -> web.Response:
+        """Serve /users/{id}/accounts."""
+        return self._wrong_user(request) or self._respond(request, self.accounts)
+
+    async def _handle_transaction_accounts(self, request: web.Request) -> web.Response:
+        """Serve /users/{id}/transaction_accounts."""
+        return self._wrong_user(request) or self._respond(
+            request, self.transaction_accounts
+        )
+
+    async def _handle_categories(self, request: web.Request) -> web.Response:
+        """Serve /users/{id}/categories as a nested tree."""
+        categories = {
+            category["id"]: {**category, "is_transfer": False, "children": []}
+            for category in PARENT_CATEGORIES + CATEGORIES
+        }
+        tree = []
+        for category in categories.values():
+            parent = categories.get(category["parent_id"])
+            (parent["children"] if parent else tree).append(category)
+        return self._wrong_user(request) or self._respond(request, tree)
+
+    async def _handle_transactions(self, request: web.Request) -> web.Response:
+        """Serve one page of /transaction_accounts/{id}/transactions."""
+        ta_id = int(request.match_info["ta_id"])
+        if ta_id not in self.transactions or ta_id in self.not_found:
+            return web.json_response({"error": "Not found"}, status=404)
+
+        transactions = self.transactions[ta_id]
+        updated_since = request.query.get("updated_since")
+        if updated_since:
+            transactions = [t for t in transactions if t["updated_at"] > updated_since]
+
+        page = int(request.query.get("page", 1))
+        per_page = int(request.query.get("per_page", 30))
+        start = (page - 1) * per_page
+        body = transactions[start : start + per_page]
+
+        headers = {"Total": str(len(transactions)), "Per-Page": str(per_page)}
+        if start + per_page < len(transactions):
+            next_url = request.url.update_query(page=page + 1)
+            headers["Link"] = '<{}>; rel="next"'.format(next_url)
+        return self._respond(request, body, headers)
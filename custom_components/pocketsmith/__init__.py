@@ -1,36 +1,147 @@
 """The PocketSmith integration."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
-from .const import DOMAIN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-from .coordinator import PocketSmithDataUpdateCoordinator
+from .budget import PocketSmithBudgetCoordinator, budget_store
+from .const import (
+    ACCOUNT_TYPES,
+    DOMAIN,
+    CONF_ACCOUNT_TYPES,
+    CONF_BUDGET_INTERVAL,
+    CONF_FETCH_CONCURRENCY,
+    CONF_SCAN_INTERVAL,
+    CONF_TRANSACTIONS_INTERVAL,
+    CONF_TRANSACTIONS_PER_ACCOUNT,
+    CONF_USER_ID,
+    DEFAULT_BUDGET_INTERVAL,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRANSACTIONS_INTERVAL,
+    DEFAULT_TRANSACTIONS_PER_ACCOUNT,
+)
+from .coordinator import (
+    TIER_BALANCES,
+    TIER_TRANSACTIONS,
+    PocketSmithDataUpdateCoordinator,
+    snapshot_store,
+    transaction_database,
+)
+from .rate_limit import async_get_rate_limiter
+from .transaction_db import MAX_QUERY_LIMIT, TransactionQuery
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 SERVICE_REFRESH = "refresh"
+SERVICE_QUERY_TRANSACTIONS = "query_transactions"
+
+ATTR_ENTRY_ID = "entry_id"
+ATTR_ACCOUNT_ID = "account_id"
+ATTR_CATEGORY_ID = "category_id"
+ATTR_CATEGORY = "category"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_PAYEE = "payee"
+ATTR_MIN_AMOUNT = "min_amount"
+ATTR_MAX_AMOUNT = "max_amount"
+ATTR_UNCATEGORIZED = "uncategorized"
+ATTR_LIMIT = "limit"
 
 # Service schema
-SERVICE_REFRESH_SCHEMA = vol.Schema({})
+SERVICE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_ACCOUNT_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+    }
+)
+
+SERVICE_QUERY_TRANSACTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_ACCOUNT_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_PAYEE): cv.string,
+        vol.Optional(ATTR_MIN_AMOUNT): vol.Coerce(float),
+        vol.Optional(ATTR_MAX_AMOUNT): vol.Coerce(float),
+        vol.Optional(ATTR_CATEGORY): cv.string,
+        vol.Optional(ATTR_CATEGORY_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Optional(ATTR_UNCATEGORIZED, default=False): cv.boolean,
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_QUERY_LIMIT)
+        ),
+    }
+)
+
+
+def _cached_user_id(entry: ConfigEntry) -> int | None:
+    """Return the PocketSmith user id cached for this entry, if known.
+
+    Entries created before the id was stored still carry it as unique_id.
+    """
+    user_id = entry.data.get(CONF_USER_ID)
+    if user_id is None and entry.unique_id and entry.unique_id.isdigit():
+        user_id = int(entry.unique_id)
+    return user_id
+
+
+def _loaded_coordinators(
+    hass: HomeAssistant, entry_ids: set[str]
+) -> list[PocketSmithDataUpdateCoordinator]:
+    """Return the coordinators of the loaded entries, optionally filtered by id."""
+    return [
+        coordinator
+        for entry_id, coordinator in hass.data[DOMAIN].items()
+        if isinstance(coordinator, PocketSmithDataUpdateCoordinator)
+        and (not entry_ids or entry_id in entry_ids)
+    ]
+
+
+def _entry_config(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the entry's settings, with options overriding the initial data."""
+    return {**entry.data, **entry.options}
+
+
+def _intervals(config: dict[str, Any]) -> tuple[timedelta, timedelta]:
+    """Return the balance and transaction polling intervals."""
+    scan_interval_minutes = config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    # Transactions are polled on their own, slower cadence
+    transactions_interval_minutes = max(
+        scan_interval_minutes,
+        config.get(CONF_TRANSACTIONS_INTERVAL, DEFAULT_TRANSACTIONS_INTERVAL),
+    )
+    return (
+        timedelta(minutes=scan_interval_minutes),
+        timedelta(minutes=transactions_interval_minutes),
+    )
+
+
+def _account_types(config: dict[str, Any]) -> set[str] | None:
+    """Return the tracked account types, or None to track every type."""
+    selected = set(config.get(CONF_ACCOUNT_TYPES) or ())
+    if not selected or selected >= ACCOUNT_TYPES.keys():
+        return None
+    return selected
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PocketSmith from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Get scan interval from config, default to 5 minutes
-    scan_interval_minutes = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    scan_interval = timedelta(minutes=scan_interval_minutes)
+    config = _entry_config(entry)
+    scan_interval, transactions_interval = _intervals(config)
 
     coordinator = PocketSmithDataUpdateCoordinator(
         hass,
@@ -39,24 +150,118 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=scan_interval,
         entry_id=entry.entry_id,
         username=entry.data.get(CONF_USERNAME) or entry.title.replace("PocketSmith - ", "").strip().lower(),
+        fetch_concurrency=config.get(CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY),
+        transactions_per_account=config.get(
+            CONF_TRANSACTIONS_PER_ACCOUNT, DEFAULT_TRANSACTIONS_PER_ACCOUNT
+        ),
+        rate_limiter=async_get_rate_limiter(hass, entry.data[CONF_API_KEY]),
+        user_id=_cached_user_id(entry),
+        transactions_interval=transactions_interval,
+        account_types=_account_types(config),
+    )
+
+    # Budget and forecast data have their own, much longer, interval and are
+    # only fetched once one of their (disabled by default) entities is enabled
+    coordinator.budget = PocketSmithBudgetCoordinator(
+        hass,
+        coordinator,
+        update_interval=timedelta(
+            minutes=config.get(CONF_BUDGET_INTERVAL, DEFAULT_BUDGET_INTERVAL)
+        ),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Populate entities from the last saved snapshot when available so that
+    # startup does not wait on the PocketSmith API; refresh in the background.
+    restored = await coordinator.async_load_snapshot()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
+
+    if restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            "{}_refresh_{}".format(DOMAIN, entry.entry_id),
+        )
+
     # Register services (only once, not per entry)
     async def handle_refresh(call: ServiceCall) -> None:
-        """Handle the refresh service call."""
-        _LOGGER.info("Manual refresh requested for all PocketSmith integrations")
-        # Refresh all coordinators
-        for coordinator in hass.data[DOMAIN].values():
-            if isinstance(coordinator, PocketSmithDataUpdateCoordinator):
-                await coordinator.async_request_refresh()
-
-    # Only register service if it doesn't exist yet
+        """Handle the refresh service call.
+
+        Entries are refreshed concurrently. Without filters every entry's
+        balances and transactions are refreshed; entry_id limits the entries,
+        and account_id limits the transaction fetch to those accounts.
+        """
+        entry_ids = set(call.data.get(ATTR_ENTRY_ID, []))
+        account_ids = set(call.data.get(ATTR_ACCOUNT_ID, []))
+        if entry_ids:
+            _LOGGER.info("Manual refresh requested for PocketSmith entries %s", sorted(entry_ids))
+        else:
+            _LOGGER.info("Manual refresh requested for all PocketSmith integrations")
+
+        coordinators = _loaded_coordinators(hass, entry_ids)
+        if account_ids:
+            # Only entries that hold one of the requested accounts
+            coordinators = [
+                coordinator
+                for coordinator in coordinators
+                if coordinator.data
+                and account_ids & coordinator.data["transaction_accounts"].keys()
+            ]
+            tiers = (TIER_BALANCES,)
+        else:
+            # Include transactions even if they are not yet due
+            tiers = (TIER_BALANCES, TIER_TRANSACTIONS)
+
+        await asyncio.gather(
+            *(
+                coordinator.async_refresh_now(tiers, account_ids)
+                for coordinator in coordinators
+            )
+        )
+
+    async def handle_query_transactions(call: ServiceCall) -> ServiceResponse:
+        """Handle the query_transactions service call.
+
+        Searches the local transaction databases of the selected entries
+        (all by default) and returns the newest matches first.
+        """
+        start_date = call.data.get(ATTR_START_DATE)
+        end_date = call.data.get(ATTR_END_DATE)
+        limit = call.data[ATTR_LIMIT]
+        query = TransactionQuery(
+            account_ids=tuple(call.data.get(ATTR_ACCOUNT_ID, ())) or None,
+            start_date=start_date.isoformat() if start_date else None,
+            end_date=end_date.isoformat() if end_date else None,
+            payee=call.data.get(ATTR_PAYEE),
+            min_amount=call.data.get(ATTR_MIN_AMOUNT),
+            max_amount=call.data.get(ATTR_MAX_AMOUNT),
+            category=call.data.get(ATTR_CATEGORY),
+            category_ids=tuple(call.data.get(ATTR_CATEGORY_ID, ())) or None,
+            uncategorized=call.data[ATTR_UNCATEGORIZED],
+            limit=limit,
+        )
+
+        coordinators = _loaded_coordinators(hass, set(call.data.get(ATTR_ENTRY_ID, [])))
+        results = await asyncio.gather(
+            *(coordinator.async_query_transactions(query) for coordinator in coordinators)
+        )
+        transactions = []
+        for coordinator, rows in zip(coordinators, results):
+            for row in rows:
+                row[ATTR_ENTRY_ID] = coordinator.entry_id
+                transactions.append(row)
+        # Each entry is already sorted; merge them and apply the limit overall
+        transactions.sort(key=lambda row: (row["date"] or "", row["id"]), reverse=True)
+        transactions = transactions[:limit]
+        return {"transactions": transactions, "count": len(transactions)}
+
+    # Only register services if they don't exist yet
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH):
         hass.services.async_register(
             DOMAIN,
@@ -64,17 +269,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             handle_refresh,
             schema=SERVICE_REFRESH_SCHEMA,
         )
+    if not hass.services.has_service(DOMAIN, SERVICE_QUERY_TRANSACTIONS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_QUERY_TRANSACTIONS,
+            handle_query_transactions,
+            schema=SERVICE_QUERY_TRANSACTIONS_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
 
     return True
 
 
+async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator without a reload."""
+    coordinator: PocketSmithDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    config = _entry_config(entry)
+    scan_interval, transactions_interval = _intervals(config)
+
+    changed = coordinator.async_apply_options(
+        update_interval=scan_interval,
+        transactions_interval=transactions_interval,
+        fetch_concurrency=config.get(CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY),
+        transactions_per_account=config.get(
+            CONF_TRANSACTIONS_PER_ACCOUNT, DEFAULT_TRANSACTIONS_PER_ACCOUNT
+        ),
+        account_types=_account_types(config),
+    )
+    if coordinator.budget is not None:
+        coordinator.budget.update_interval = timedelta(
+            minutes=config.get(CONF_BUDGET_INTERVAL, DEFAULT_BUDGET_INTERVAL)
+        )
+    if changed:
+        _LOGGER.debug("Applied PocketSmith options for %s: %s", entry.title, entry.options)
+        await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await hass.async_add_executor_job(coordinator.database.close)
         
-        # If this was the last entry, unregister the service
+        # If this was the last entry, unregister the services
         if not hass.data[DOMAIN]:
             hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+            hass.services.async_remove(DOMAIN, SERVICE_QUERY_TRANSACTIONS)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data when a config entry is deleted."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await budget_store(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(transaction_database(hass, entry.entry_id).remove)
@@ -0,0 +1,206 @@
+"""Budget summary and forecast data for PocketSmith.
+
+Budget summaries are comparatively expensive for PocketSmith to compute and
+change slowly, so they are fetched by their own coordinator on a long
+interval instead of with every balance poll. The coordinator has no
+listeners until a budget or forecast entity is enabled (they are disabled by
+default), so nothing is requested unless the data is used. The last result
+is stored on disk and reused across restarts while it is younger than the
+update interval.
+"""
+from __future__ import annotations
+
+import calendar
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+import logging
+from typing import Any, Mapping
+from urllib.parse import urlencode
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import PocketSmithDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+BUDGET_EXPENSE = "expense"
+BUDGET_INCOME = "income"
+
+
+def budget_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding an entry's last budget summary."""
+    return Store(hass, STORAGE_VERSION, "{}.{}.budget".format(DOMAIN, entry_id))
+
+
+def _amount(value: Any) -> float | None:
+    """Return an API amount as a float, or None."""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetPeriod:
+    """Budget figures for one side (expense or income) of one period."""
+
+    start_date: str | None
+    end_date: str | None
+    currency_code: str | None
+    budgeted: float | None
+    actual: float | None
+    forecast: float | None
+    refunds: float | None
+    over_budget: bool
+    over_by: float | None
+    under_by: float | None
+    percentage_used: float | None
+
+    @classmethod
+    def from_api(cls, analysis: Mapping[str, Any]) -> BudgetPeriod | None:
+        """Create from a budget analysis object, using its first period."""
+        periods = analysis.get("periods") or []
+        if not periods:
+            return None
+        period = periods[0]
+        return cls(
+            start_date=period.get("start_date"),
+            end_date=period.get("end_date"),
+            currency_code=period.get("currency_code") or analysis.get("currency_code"),
+            budgeted=_amount(period.get("budgeted_amount")),
+            actual=_amount(period.get("actual_amount")),
+            forecast=_amount(period.get("forecast_amount")),
+            refunds=_amount(period.get("refund_amount")),
+            over_budget=bool(period.get("over_budget")),
+            over_by=_amount(period.get("over_by")),
+            under_by=_amount(period.get("under_by")),
+            percentage_used=_amount(period.get("percentage_used")),
+        )
+
+
+def _parse_summary(payload: Any) -> dict[str, BudgetPeriod | None]:
+    """Return the expense and income figures from a budget_summary response."""
+    package = payload[0] if isinstance(payload, list) and payload else payload
+    if not isinstance(package, dict):
+        package = {}
+    return {
+        side: BudgetPeriod.from_api(package[side]) if isinstance(package.get(side), dict) else None
+        for side in (BUDGET_EXPENSE, BUDGET_INCOME)
+    }
+
+
+def _month_bounds(today: date) -> tuple[date, date]:
+    """Return the first and last day of the month containing today."""
+    last_day = calendar.monthrange(today.year, today.month)[1]
+    return today.replace(day=1), today.replace(day=last_day)
+
+
+class PocketSmithBudgetCoordinator(DataUpdateCoordinator):
+    """Fetch the current month's budget summary on a long interval."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: PocketSmithDataUpdateCoordinator,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the budget coordinator."""
+        self.client = client
+        self._store = budget_store(hass, client.entry_id)
+        self._cache_loaded = False
+        self._first_refresh_started = False
+        self.fetched_at: datetime | None = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="PocketSmith budget",
+            update_interval=update_interval,
+        )
+
+    async def async_ensure_data(self) -> None:
+        """Fetch the summary once when the first entity using it is added.
+
+        The coordinator only polls while it has listeners, so this is what
+        makes the first request when a budget entity is enabled.
+        """
+        if self.data is not None or self._first_refresh_started:
+            return
+        self._first_refresh_started = True
+        await self.async_refresh()
+
+    async def _async_load_cached(self, month: str) -> dict[str, Any] | None:
+        """Return the stored summary if it is for this month and still fresh."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Unable to load stored PocketSmith budget: %s", err)
+            return None
+        if not stored or stored.get("month") != month:
+            return None
+
+        fetched_at = dt_util.parse_datetime(stored.get("fetched_at") or "")
+        if fetched_at is None or dt_util.utcnow() - fetched_at >= self.update_interval:
+            return None
+
+        self.fetched_at = fetched_at
+        return {
+            "month": month,
+            **{
+                side: BudgetPeriod(**values) if values else None
+                for side, values in stored.get("summary", {}).items()
+            },
+        }
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the budget summary for the current month."""
+        start, end = _month_bounds(dt_util.now().date())
+        month = start.strftime("%Y-%m")
+
+        # Reuse the summary saved before a restart while it is fresh
+        if not self._cache_loaded:
+            self._cache_loaded = True
+            if (cached := await self._async_load_cached(month)) is not None:
+                _LOGGER.debug("Using stored PocketSmith budget fetched at %s", self.fetched_at)
+                return cached
+
+        user_id = self.client.user_id
+        if user_id is None:
+            raise UpdateFailed("PocketSmith user id is not known yet")
+
+        params = {
+            "period": "months",
+            "interval": 1,
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+        }
+        endpoint = "users/{}/budget_summary?{}".format(user_id, urlencode(params))
+        _LOGGER.debug("Fetching budget summary from /users/%s/budget_summary", user_id)
+        try:
+            payload = await self.client.async_fetch_endpoint(endpoint)
+        except UpdateFailed:
+            raise
+        except Exception as err:
+            raise UpdateFailed("Error fetching budget summary: {}".format(err)) from err
+
+        summary = _parse_summary(payload)
+        self.fetched_at = dt_util.utcnow()
+        fetched_at = self.fetched_at.isoformat()
+        self._store.async_delay_save(
+            lambda: {
+                "month": month,
+                "fetched_at": fetched_at,
+                "summary": {
+                    side: asdict(period) if period else None
+                    for side, period in summary.items()
+                },
+            },
+            1,
+        )
+        return {"month": month, **summary}
@@ -0,0 +1,101 @@
+"""Per-account circuit breaker for failing transaction fetches."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import random
+from typing import Any, Iterable, Mapping
+
+# Consecutive failures after which an account's transactions stop being
+# requested until its backoff expires
+FAILURE_THRESHOLD = 3
+
+# Backoff after the breaker opens, doubled with every further failure
+BACKOFF_INITIAL = timedelta(minutes=5)
+BACKOFF_MAX = timedelta(hours=6)
+
+# Each backoff is randomly lengthened or shortened by up to this fraction so
+# accounts that failed together are not retried together
+BACKOFF_JITTER = 0.2
+
+
+@dataclass(slots=True)
+class AccountFailures:
+    """Consecutive failures of one account and when it may be retried."""
+
+    failures: int = 0
+    retry_at: datetime | None = None
+    last_error: str | None = None
+
+
+class CircuitBreaker:
+    """Track consecutive transaction fetch failures per account.
+
+    After FAILURE_THRESHOLD failures in a row the breaker opens and the
+    account is skipped until its backoff expires. The next attempt is a
+    single trial: success closes the breaker, failure opens it again for
+    twice as long, up to BACKOFF_MAX.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with every breaker closed."""
+        self._accounts: dict[Any, AccountFailures] = {}
+
+    def allow(self, account_id: Any, now: datetime) -> bool:
+        """Return True if the account's transactions may be requested."""
+        state = self._accounts.get(account_id)
+        return state is None or state.retry_at is None or state.retry_at <= now
+
+    def record_success(self, account_id: Any) -> None:
+        """Close the breaker after a successful fetch."""
+        self._accounts.pop(account_id, None)
+
+    def record_failure(self, account_id: Any, error: Any, now: datetime) -> datetime | None:
+        """Count a failed fetch and return the retry time if the breaker opened."""
+        state = self._accounts.setdefault(account_id, AccountFailures())
+        state.failures += 1
+        state.last_error = str(error)
+        if state.failures < FAILURE_THRESHOLD:
+            return None
+        backoff = min(
+            BACKOFF_MAX, BACKOFF_INITIAL * 2 ** (state.failures - FAILURE_THRESHOLD)
+        ) * random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+        state.retry_at = now + backoff
+        return state.retry_at
+
+    def get(self, account_id: Any) -> AccountFailures | None:
+        """Return the failure state of an account, or None if it is healthy."""
+        return self._accounts.get(account_id)
+
+    def failing(self) -> dict[Any, AccountFailures]:
+        """Return the state of every account whose last fetch failed."""
+        return dict(self._accounts)
+
+    def forget(self, account_ids: Iterable[Any]) -> None:
+        """Drop the state of accounts that no longer exist."""
+        for account_id in account_ids:
+            self._accounts.pop(account_id, None)
+
+    def as_dict(self) -> dict[Any, dict[str, Any]]:
+        """Return a JSON-serialisable copy for the snapshot."""
+        return {
+            account_id: {
+                "failures": state.failures,
+                "retry_at": state.retry_at.isoformat() if state.retry_at else None,
+                "last_error": state.last_error,
+            }
+            for account_id, state in self._accounts.items()
+        }
+
+    def restore(self, stored: Mapping[Any, Mapping[str, Any]]) -> None:
+        """Load state saved with as_dict()."""
+        for account_id, item in stored.items():
+            try:
+                retry_at = item.get("retry_at")
+                self._accounts[account_id] = AccountFailures(
+                    failures=int(item["failures"]),
+                    retry_at=datetime.fromisoformat(retry_at) if retry_at else None,
+                    last_error=item.get("last_error"),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
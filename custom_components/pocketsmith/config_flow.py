@@ -10,11 +10,30 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_API_KEY, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .const import DOMAIN, API_BASE_URL, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ACCOUNT_TYPES,
+    API_BASE_URL,
+    CONF_ACCOUNT_TYPES,
+    CONF_BUDGET_INTERVAL,
+    CONF_FETCH_CONCURRENCY,
+    CONF_SCAN_INTERVAL,
+    CONF_TRANSACTIONS_INTERVAL,
+    CONF_TRANSACTIONS_PER_ACCOUNT,
+    CONF_USER_ID,
+    DEFAULT_BUDGET_INTERVAL,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRANSACTIONS_INTERVAL,
+    DEFAULT_TRANSACTIONS_PER_ACCOUNT,
+    DOMAIN,
+    MAX_FETCH_CONCURRENCY,
+    MAX_TRANSACTIONS_PER_ACCOUNT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -114,6 +133,14 @@ class PocketSmithConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> PocketSmithOptionsFlow:
+        """Return the options flow for this handler."""
+        return PocketSmithOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -137,7 +164,11 @@ class PocketSmithConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
                 return self.async_create_entry(
                     title="PocketSmith - {}".format(info["title"]),
-                    data={**user_input, CONF_USERNAME: info["title"]},
+                    data={
+                        **user_input,
+                        CONF_USERNAME: info["title"],
+                        CONF_USER_ID: int(info["user_id"]) if info["user_id"].isdigit() else None,
+                    },
                 )
 
         return self.async_show_form(
@@ -145,6 +176,58 @@ class PocketSmithConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class PocketSmithOptionsFlow(config_entries.OptionsFlow):
+    """Tune polling and fetching for a configured entry.
+
+    Changes are applied to the running coordinator without a reload.
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        # Options override the values chosen when the entry was created
+        current = {**self._entry.data, **self._entry.options}
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=current.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Required(
+                    CONF_TRANSACTIONS_INTERVAL,
+                    default=current.get(CONF_TRANSACTIONS_INTERVAL, DEFAULT_TRANSACTIONS_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Required(
+                    CONF_TRANSACTIONS_PER_ACCOUNT,
+                    default=current.get(
+                        CONF_TRANSACTIONS_PER_ACCOUNT, DEFAULT_TRANSACTIONS_PER_ACCOUNT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_TRANSACTIONS_PER_ACCOUNT)),
+                vol.Required(
+                    CONF_FETCH_CONCURRENCY,
+                    default=current.get(CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_FETCH_CONCURRENCY)),
+                vol.Required(
+                    CONF_BUDGET_INTERVAL,
+                    default=current.get(CONF_BUDGET_INTERVAL, DEFAULT_BUDGET_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=1440)),
+                vol.Required(
+                    CONF_ACCOUNT_TYPES,
+                    default=current.get(CONF_ACCOUNT_TYPES) or list(ACCOUNT_TYPES),
+                ): cv.multi_select(ACCOUNT_TYPES),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
 
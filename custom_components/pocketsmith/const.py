@@ -4,8 +4,37 @@ DOMAIN = "pocketsmith"
 API_BASE_URL = "https://api.pocketsmith.com/v2"
 
 # Configuration
+CONF_USER_ID = "user_id"
 CONF_SCAN_INTERVAL = "scan_interval"
-DEFAULT_SCAN_INTERVAL = 5  # minutes
+DEFAULT_SCAN_INTERVAL = 5  # minutes, drives account balances
+CONF_TRANSACTIONS_INTERVAL = "transactions_interval"
+DEFAULT_TRANSACTIONS_INTERVAL = 60  # minutes, full re-check of every account
+CONF_FETCH_CONCURRENCY = "fetch_concurrency"
+DEFAULT_FETCH_CONCURRENCY = 5  # simultaneous per-account transaction requests
+CONF_TRANSACTIONS_PER_ACCOUNT = "transactions_per_account"
+DEFAULT_TRANSACTIONS_PER_ACCOUNT = 20
+CONF_BUDGET_INTERVAL = "budget_interval"
+DEFAULT_BUDGET_INTERVAL = 360  # minutes, budget summary and forecast
+CONF_ACCOUNT_TYPES = "account_types"  # tracked account types, all when unset
+
+# Limits of the options flow
+MAX_FETCH_CONCURRENCY = 10
+MAX_TRANSACTIONS_PER_ACCOUNT = 500
+
+# PocketSmith account types and their labels
+ACCOUNT_TYPES = {
+    "bank": "Bank",
+    "credits": "Credit cards",
+    "cash": "Cash",
+    "loans": "Loans",
+    "mortgage": "Mortgages",
+    "stocks": "Stocks and shares",
+    "vehicle": "Vehicles",
+    "property": "Property",
+    "insurance": "Insurance",
+    "other_asset": "Other assets",
+    "other_liability": "Other liabilities",
+}
 
 # Currency symbol mapping
 CURRENCY_SYMBOLS = {
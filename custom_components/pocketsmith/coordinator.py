@@ -1,19 +1,215 @@
 """DataUpdateCoordinator for PocketSmith."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Mapping
+from urllib.parse import urlencode
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
-from .const import API_BASE_URL, DEFAULT_SCAN_INTERVAL
+from .circuit_breaker import CircuitBreaker
+from .const import (
+    API_BASE_URL,
+    CONF_USER_ID,
+    DOMAIN,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_TRANSACTIONS_PER_ACCOUNT,
+)
+from .events import transaction_events
+from .json_stream import JSONArrayParser
+from .models import Transaction, build_view
+from .net_worth import NetWorthCalculator
+from .rate_limit import TokenBucket, parse_retry_after
+from .spending import CategorySpending, CategoryTree, SpendingAggregator, flatten_categories
+from .telemetry import Telemetry
+from .transaction_db import TransactionDatabase, TransactionQuery
+
+if TYPE_CHECKING:
+    from .budget import PocketSmithBudgetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Download the full transaction window at least this often so that
+# transactions deleted in PocketSmith also disappear locally
+FULL_SYNC_INTERVAL = timedelta(hours=24)
+
+# Maximum page size requested when paginating transactions (PocketSmith's
+# own maximum), so a full sync of any per-account limit is one request
+TRANSACTIONS_PAGE_SIZE = 1000
+
+# Size of the chunks in which transaction pages are read and decoded
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Pages smaller than this are decoded in one call, which costs less CPU;
+# larger ones are decoded incrementally to bound peak memory. A transaction
+# is about 1 KiB, so the default 20-transaction pages are decoded whole,
+# while full syncs of a large per-account limit and busy incremental syncs
+# (up to TRANSACTIONS_PAGE_SIZE, about 1 MiB) are streamed.
+STREAM_MIN_BYTES = 256 * 1024
+
+# On-disk snapshot of the last successful refresh, used to populate
+# entities at startup without waiting for the API
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+
+# 429 handling: retry in-line when the server asks for a short wait only
+RATE_LIMIT_MAX_RETRIES = 2
+RATE_LIMIT_MAX_WAIT = 30  # seconds
+RATE_LIMIT_DEFAULT_DELAY = 60  # seconds, when no Retry-After is given
+
+# Refresh tiers. Balances are fetched on every poll (update_interval);
+# metadata (/me profile and accounts) and transactions have their own cadence.
+# The user id itself is cached indefinitely.
+TIER_METADATA = "metadata"
+TIER_BALANCES = "balances"
+TIER_TRANSACTIONS = "transactions"
+ALL_TIERS = (TIER_METADATA, TIER_BALANCES, TIER_TRANSACTIONS)
+METADATA_REFRESH_INTERVAL = timedelta(hours=24)
+
+
+def _parse_timestamp(ts: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp from the API, or return None."""
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+
+def _is_later(ts: str, other: str | None) -> bool:
+    """Return True if timestamp ts is later than other (or other is unset)."""
+    parsed = _parse_timestamp(ts)
+    if parsed is None:
+        return False
+    other_parsed = _parse_timestamp(other)
+    return other_parsed is None or parsed > other_parsed
+
+
+class RateLimited(UpdateFailed):
+    """Error to indicate PocketSmith rejected a request with HTTP 429."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize with the seconds until requests may be sent again."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Decoded response body and its HTTP validators."""
+
+    endpoint: str
+    etag: str | None
+    last_modified: str | None
+    data: Any
+
+
+@dataclass(slots=True)
+class _AccountSync:
+    """Outcome of syncing one account's transactions."""
+
+    ta_id: Any
+    # None when the account returned 404 and should be excluded
+    transactions: list[Transaction] | None
+    # Every transaction fetched by the sync, before the in-memory window is
+    # trimmed, to be written to the database; None if nothing was synced
+    synced: list[Transaction] | None = None
+    # Whether the synced transactions replace the account's stored window
+    replace: bool = False
+    events: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the snapshot store for a config entry."""
+    return Store(hass, STORAGE_VERSION, "{}.{}".format(DOMAIN, entry_id))
+
+
+def transaction_database(hass: HomeAssistant, entry_id: str) -> TransactionDatabase:
+    """Return the local transaction database for a config entry."""
+    return TransactionDatabase(
+        hass.config.path(STORAGE_DIR, "{}.{}.db".format(DOMAIN, entry_id))
+    )
+
+
+def _restore_keys(value: dict[str, Any]) -> dict[Any, Any]:
+    """Convert numeric string keys back to ints after a JSON round trip.
+
+    PocketSmith ids are integers, but JSON object keys are always strings.
+    """
+    return {
+        int(key) if isinstance(key, str) and key.isdigit() else key: item
+        for key, item in value.items()
+    }
+
+
+def _account_version(ta: dict[str, Any]) -> tuple[str | None, str | None]:
+    """Return the fields that change when an account's feed brings new data."""
+    return (ta.get("updated_at"), ta.get("current_balance_date"))
+
+
+def _is_auth_error(err: UpdateFailed) -> bool:
+    """Return True if an endpoint error was an authentication failure."""
+    err_str = str(err)
+    return "HTTP 401" in err_str or "HTTP 403" in err_str
+
+
+def _parse_transaction(raw: dict[str, Any]) -> Transaction | None:
+    """Convert an API transaction to a compact record, skipping ones without an id."""
+    if raw.get("id") is None:
+        return None
+    return Transaction.from_api(raw)
+
+
+def _merge_page(
+    store: dict[Any, Transaction], page: list[Transaction], cursor: str | None
+) -> str | None:
+    """Merge a page of transactions into a store, returning the new cursor.
+
+    Transactions are de-duplicated by id; the cursor is the latest
+    updated_at seen.
+    """
+    for transaction in page:
+        store[transaction.id] = transaction
+        updated_at = transaction.updated_at
+        if updated_at and _is_later(updated_at, cursor):
+            cursor = updated_at
+    return cursor
+
+
+def _next_page_url(
+    response: aiohttp.ClientResponse, page_number: int, page_length: int, received: int
+) -> str | None:
+    """Return the URL of the next page of a paginated response, if any."""
+    next_link = response.links.get("next")
+    if next_link:
+        return str(next_link["url"])
+    if not page_length:
+        return None
+    try:
+        total = int(response.headers.get("Total", 0))
+    except ValueError:
+        return None
+    if received >= total:
+        return None
+    return str(response.url.update_query(page=page_number + 1))
+
+
+def _transaction_sort_key(transaction: Transaction) -> tuple[str, int]:
+    """Sort key ordering transactions by date, then id."""
+    return transaction.sort_key
+
 
 class PocketSmithDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching PocketSmith data."""
@@ -26,12 +222,81 @@ class PocketSmithDataUpdateCoordinator(DataUpdateCoordinator):
         update_interval: timedelta,
         entry_id: str,
         username: str = "pocketsmith",
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        transactions_per_account: int = DEFAULT_TRANSACTIONS_PER_ACCOUNT,
+        rate_limiter: TokenBucket | None = None,
+        user_id: int | None = None,
+        transactions_interval: timedelta | None = None,
+        base_url: str = API_BASE_URL,
+        json_decoder: Callable[[bytes], Any] = json_loads,
+        account_types: Iterable[str] | None = None,
     ) -> None:
-        """Initialize coordinator."""
+        """Initialize coordinator.
+
+        json_decoder decodes response bodies. The default is Home Assistant's
+        json_loads, which uses orjson. account_types limits the tracked
+        transaction accounts to those types; None tracks all of them.
+        """
         self.session = session
         self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.json_decoder = json_decoder
         self.entry_id = entry_id
         self.username = username
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.transactions_per_account = max(1, transactions_per_account)
+        self.account_types = frozenset(account_types) if account_types else None
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.user_id = user_id
+        self._user_data: dict[str, Any] | None = None
+        # Tiered polling state. updated_tiers holds the tiers fetched by the
+        # latest refresh so entities can skip updates for tiers they don't read.
+        self.tier_intervals: dict[str, timedelta] = {
+            TIER_METADATA: METADATA_REFRESH_INTERVAL,
+            TIER_TRANSACTIONS: transactions_interval or update_interval,
+        }
+        self._tier_refreshed: dict[str, datetime] = {}
+        self._forced_tiers: set[str] = set()
+        self._forced_accounts: set[Any] = set()
+        # Refreshes run one at a time; a second async_refresh() waits for
+        # the running one and then fetches again. async_refresh_now holds
+        # the lock itself, recording its task as the owner.
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_owner: asyncio.Task[Any] | None = None
+        # Single-flight state for async_refresh_now
+        self._refresh_in_flight: asyncio.Future[None] | None = None
+        self._in_flight_tiers: frozenset[str] = frozenset()
+        self._in_flight_accounts: frozenset[Any] = frozenset()
+        self.updated_tiers: frozenset[str] = frozenset()
+        self._inaccessible_ta_ids: set[Any] = set()
+        # Accounts whose transaction fetches keep failing are skipped, with
+        # exponential backoff, and serve their last synced transactions
+        self.breaker = CircuitBreaker()
+        # Every synced transaction is also written to a local database that
+        # keeps history beyond the in-memory window
+        self.database = transaction_database(hass, entry_id)
+        self._database_seeded = False
+        # Incremental sync state: transactions held per account keyed by
+        # transaction id, and the latest updated_at seen per account
+        self._transaction_store: dict[Any, dict[Any, Transaction]] = {}
+        self._sync_cursors: dict[Any, str] = {}
+        # (updated_at, current_balance_date) of each account at its last
+        # successful sync, used to skip accounts whose feed has not updated
+        self._account_versions: dict[Any, tuple[str | None, str | None]] = {}
+        self._last_full_sync: datetime | None = None
+        self._store = snapshot_store(hass, entry_id)
+        # Last response per endpoint path, for conditional requests
+        self._response_cache: dict[str, _CachedResponse] = {}
+        self.telemetry = Telemetry()
+        # Category tree (refreshed with the metadata tier) and the
+        # incrementally maintained per-category spending totals
+        self._category_tree = CategoryTree({})
+        self._categories_fetched = False
+        self._spending = SpendingAggregator()
+        # Net worth, with exchange rates cached on their own schedule
+        self._net_worth = NetWorthCalculator()
+        # Budget and forecast data, fetched separately on a long interval
+        self.budget: PocketSmithBudgetCoordinator | None = None
         # PocketSmith uses X-Developer-Key header, not Bearer token
         self.headers = {"X-Developer-Key": api_key}
 
@@ -42,65 +307,400 @@ class PocketSmithDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
+    async def async_load_snapshot(self) -> bool:
+        """Populate the coordinator from the on-disk snapshot, if one exists.
+
+        Returns True if data was restored. The caller is expected to schedule
+        a live refresh afterwards, as the snapshot may be out of date.
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Unable to load stored PocketSmith snapshot: %s", err)
+            return False
+
+        if not stored or "data" not in stored:
+            return False
+
+        snapshot = stored["data"]
+        data = {
+            "user": snapshot.get("user", {}),
+            "accounts": _restore_keys(snapshot.get("accounts", {})),
+            "transaction_accounts": _restore_keys(snapshot.get("transaction_accounts", {})),
+            "transactions": {
+                ta_id: [Transaction.from_dict(transaction) for transaction in transactions]
+                for ta_id, transactions in _restore_keys(snapshot.get("transactions", {})).items()
+            },
+            "categories": _restore_keys(snapshot.get("categories", {})),
+        }
+        # Snapshots from before categories were fetched lack the key
+        self._categories_fetched = "categories" in snapshot
+
+        self._transaction_store = {
+            ta_id: {transaction.id: transaction for transaction in transactions}
+            for ta_id, transactions in data["transactions"].items()
+        }
+        self._sync_cursors = _restore_keys(stored.get("cursors", {}))
+        self._account_versions = {
+            ta_id: tuple(version)
+            for ta_id, version in _restore_keys(stored.get("account_versions", {})).items()
+        }
+        self._last_full_sync = _parse_timestamp(stored.get("last_full_sync"))
+        self._net_worth.rates.restore(stored.get("exchange_rates", {}))
+        self.breaker.restore(_restore_keys(stored.get("account_failures", {})))
+        data["stale_transactions"] = self._stale_transactions()
+        for tier, refreshed in stored.get("tier_refreshed", {}).items():
+            if (parsed := _parse_timestamp(refreshed)) is not None:
+                self._tier_refreshed[tier] = parsed
+        if data["user"].get("id") is not None:
+            self._user_data = data["user"]
+            if self.user_id is None:
+                self.user_id = data["user"]["id"]
+        self.updated_tiers = frozenset(ALL_TIERS)
+
+        data["view"] = build_view(
+            data,
+            spending=self._spending_summary(data),
+            net_worth=self._net_worth.update(
+                data["user"].get("base_currency_code"),
+                data["transaction_accounts"],
+                dt_util.utcnow(),
+            ),
+        )
+        self.data = data
+        self.last_update_success = True
+        _LOGGER.debug(
+            "Restored PocketSmith snapshot saved at %s (%d transaction accounts)",
+            stored.get("saved_at"),
+            len(data["transaction_accounts"]),
+        )
+        return True
+
+    def _async_save_snapshot(self, data: dict[str, Any]) -> None:
+        """Schedule a debounced write of the latest data to disk."""
+        saved_at = dt_util.utcnow()
+        cursors = dict(self._sync_cursors)
+        account_versions = {ta_id: list(version) for ta_id, version in self._account_versions.items()}
+        exchange_rates = self._net_worth.rates.as_dict()
+        account_failures = self.breaker.as_dict()
+        last_full_sync = self._last_full_sync
+        tier_refreshed = {
+            tier: refreshed.isoformat() for tier, refreshed in self._tier_refreshed.items()
+        }
+
+        def _snapshot() -> dict[str, Any]:
+            return {
+                "saved_at": saved_at.isoformat(),
+                "last_full_sync": last_full_sync.isoformat() if last_full_sync else None,
+                "tier_refreshed": tier_refreshed,
+                "cursors": cursors,
+                "account_versions": account_versions,
+                "exchange_rates": exchange_rates,
+                "account_failures": account_failures,
+                "data": {
+                    "user": data["user"],
+                    "accounts": data["accounts"],
+                    "transaction_accounts": data["transaction_accounts"],
+                    "transactions": {
+                        ta_id: [transaction.as_dict() for transaction in transactions]
+                        for ta_id, transactions in data["transactions"].items()
+                    },
+                    "categories": data["categories"],
+                },
+            }
+
+        self._store.async_delay_save(_snapshot, SNAPSHOT_SAVE_DELAY)
+
+    async def async_refresh_now(
+        self,
+        tiers: Iterable[str],
+        account_ids: Iterable[Any] | None = None,
+    ) -> None:
+        """Refresh the given tiers (and accounts' transactions) now.
+
+        Single-flight: if a refresh is already running and covers everything
+        requested, wait for its result instead of starting another fetch.
+        Otherwise wait for it to finish and then run one more refresh. The
+        tiers and accounts are only forced once the refresh lock is held, so
+        a poll queued in the meantime cannot take them over.
+        """
+        tiers = frozenset(tiers)
+        account_ids = frozenset(account_ids or ())
+
+        while (in_flight := self._refresh_in_flight) is not None:
+            covered = tiers <= self._in_flight_tiers and account_ids <= self._in_flight_accounts
+            await asyncio.shield(in_flight)
+            if covered:
+                _LOGGER.debug("Joined in-flight PocketSmith refresh")
+                return
+
+        async with self._refresh_lock:
+            self.async_force_tiers(tiers)
+            self._forced_accounts.update(account_ids)
+            self._refresh_in_flight = self.hass.loop.create_future()
+            self._in_flight_tiers = tiers
+            self._in_flight_accounts = account_ids
+            self._refresh_owner = asyncio.current_task()
+            try:
+                await self.async_refresh()
+            finally:
+                self._refresh_owner = None
+                self._finish_refresh()
+
+    @callback
+    def async_apply_options(
+        self,
+        update_interval: timedelta,
+        transactions_interval: timedelta,
+        fetch_concurrency: int,
+        transactions_per_account: int,
+        account_types: Iterable[str] | None,
+    ) -> bool:
+        """Apply options to the running coordinator.
+
+        Returns True if anything changed, in which case transactions are
+        re-checked on the next refresh. When more transactions per account
+        are kept, that refresh is a full sync so the older transactions are
+        downloaded.
+        """
+        settings = (
+            update_interval,
+            transactions_interval,
+            max(1, fetch_concurrency),
+            max(1, transactions_per_account),
+            frozenset(account_types) if account_types else None,
+        )
+        current = (
+            self.update_interval,
+            self.tier_intervals[TIER_TRANSACTIONS],
+            self.fetch_concurrency,
+            self.transactions_per_account,
+            self.account_types,
+        )
+        if settings == current:
+            return False
+
+        if settings[3] > self.transactions_per_account:
+            self._last_full_sync = None
+        (
+            self.update_interval,
+            self.tier_intervals[TIER_TRANSACTIONS],
+            self.fetch_concurrency,
+            self.transactions_per_account,
+            self.account_types,
+        ) = settings
+        self.async_force_tiers((TIER_TRANSACTIONS,))
+        return True
+
+    @callback
+    def _finish_refresh(self) -> None:
+        """Release anyone waiting on the in-flight refresh."""
+        in_flight = self._refresh_in_flight
+        self._refresh_in_flight = None
+        self._in_flight_tiers = frozenset()
+        self._in_flight_accounts = frozenset()
+        if in_flight is not None and not in_flight.done():
+            in_flight.set_result(None)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from PocketSmith API."""
+        if self._refresh_owner is asyncio.current_task():
+            # Called from async_refresh_now, which already holds the lock
+            return await self._async_timed_fetch()
+        async with self._refresh_lock:
+            return await self._async_timed_fetch()
+
+    async def _async_timed_fetch(self) -> dict[str, Any]:
+        """Fetch the due tiers, recording the refresh in telemetry."""
+        # Scheduled polls register as in flight too, so that a manual
+        # refresh arriving meanwhile can attach to them
+        if self._refresh_in_flight is None:
+            self._refresh_in_flight = self.hass.loop.create_future()
+        start = time.monotonic()
+        success = False
+        try:
+            data = await self._async_fetch_data()
+            success = True
+            return data
+        finally:
+            self.telemetry.record_refresh(time.monotonic() - start, success)
+            self._finish_refresh()
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch the due tiers from the PocketSmith API."""
         _LOGGER.debug("Starting PocketSmith data fetch")
         
         try:
-            # Fetch user information
-            _LOGGER.debug("Fetching user information from /me")
-            user_data = await self._fetch_endpoint("me")
-            user_id = user_data.get("id")
-            _LOGGER.debug("Successfully fetched user data: %s (ID: %s)", user_data.get("login", "unknown"), user_id)
+            # Work out which tiers are due. Balances (transaction_accounts)
+            # are fetched on every poll; metadata and transactions only when
+            # their own interval has elapsed or a refresh was forced.
+            now = dt_util.utcnow()
+            due_tiers = {TIER_BALANCES} | self._forced_tiers
+            due_tiers.update(tier for tier in self.tier_intervals if self._tier_due(tier, now))
+            self._forced_tiers = set()
+            forced_accounts = self._forced_accounts
+            self._forced_accounts = set()
+            self._in_flight_tiers = frozenset(due_tiers)
+            self._in_flight_accounts = frozenset(forced_accounts)
+            self.updated_tiers = frozenset()
+            previous = self.data or {}
+            _LOGGER.debug("Refreshing PocketSmith tiers: %s", sorted(due_tiers))
 
-            # Fetch accounts using user ID
-            _LOGGER.debug("Fetching accounts from /users/%s/accounts", user_id)
-            accounts = await self._fetch_endpoint("users/{}/accounts".format(user_id))
-            _LOGGER.debug("Successfully fetched %d accounts", len(accounts))
+            # The user id is cached (config entry / snapshot), so /me is only
+            # on the critical path when it is unknown. A due profile refresh
+            # runs alongside the account requests.
+            user_refresh = None
+            if self.user_id is None:
+                await self._async_refresh_user()
+                due_tiers.add(TIER_METADATA)
+            elif TIER_METADATA in due_tiers:
+                user_refresh = asyncio.create_task(self._async_try_refresh_user())
 
-            # Fetch transaction accounts using user ID
-            _LOGGER.debug("Fetching transaction accounts from /users/%s/transaction_accounts", user_id)
-            transaction_accounts = await self._fetch_endpoint("users/{}/transaction_accounts".format(user_id))
-            _LOGGER.debug("Successfully fetched %d transaction accounts", len(transaction_accounts))
+            include_accounts = TIER_METADATA in due_tiers
+            try:
+                transaction_accounts, accounts = await self._fetch_user_accounts(include_accounts)
+            except UpdateFailed as err:
+                if not _is_auth_error(err):
+                    raise
+                # The cached user id may no longer match this API key
+                _LOGGER.info(
+                    "Cached PocketSmith user id %s was rejected (%s), re-fetching /me",
+                    self.user_id,
+                    err,
+                )
+                if user_refresh is not None:
+                    await user_refresh
+                    user_refresh = None
+                self.user_id = None
+                await self._async_refresh_user()
+                transaction_accounts, accounts = await self._fetch_user_accounts(include_accounts)
 
-            # Fetch transactions for each transaction account (last 20)
-            # Track which accounts are inaccessible (e.g. archived/closed) to exclude them
-            transactions_by_account = {}
-            inaccessible_ta_ids = set()
-            for ta in transaction_accounts:
-                ta_id = ta["id"]
-                ta_name = ta.get("name", str(ta_id))
-                _LOGGER.debug("Fetching transactions for account %s (%s)", ta_id, ta_name)
-                try:
-                    transactions = await self._fetch_endpoint(
-                        "transaction_accounts/{}/transactions?per_page=20".format(ta_id)
+            if user_refresh is not None:
+                await user_refresh
+            if self.account_types is not None:
+                transaction_accounts = [
+                    ta for ta in transaction_accounts if ta.get("type") in self.account_types
+                ]
+            user_data = self._user_data or {"id": self.user_id}
+            if accounts is None:
+                accounts_by_id = previous.get("accounts", {})
+            else:
+                accounts_by_id = {account["id"]: account for account in accounts}
+
+            categories = None
+            if include_accounts:
+                categories = await self._async_try_fetch_categories()
+            if categories is None:
+                categories = previous.get("categories", {})
+
+            # Sync transactions concurrently, bounded by the configured
+            # concurrency cap. On every poll, accounts that have never been
+            # synced or whose updated_at / current_balance_date changed since
+            # their last sync are fetched; the previous lists are carried
+            # forward for the rest. When the transactions tier is due every
+            # account is re-checked. Between full syncs only transactions
+            # changed since each account's cursor are fetched. Accounts that
+            # returned 404 (e.g. archived/closed) stay excluded until the next
+            # transactions tier refresh re-checks them.
+            current_ta_ids = {ta["id"] for ta in transaction_accounts}
+            if TIER_TRANSACTIONS in due_tiers:
+                to_sync = list(transaction_accounts)
+                self._inaccessible_ta_ids = set()
+            else:
+                to_sync = [
+                    ta
+                    for ta in transaction_accounts
+                    if ta["id"] not in self._inaccessible_ta_ids
+                    and (
+                        ta["id"] in forced_accounts
+                        or ta["id"] not in self._transaction_store
+                        or self._account_versions.get(ta["id"]) != _account_version(ta)
                     )
-                    transactions_by_account[ta_id] = transactions
-                    _LOGGER.debug("Fetched %d transactions for account %s (%s)", len(transactions), ta_id, ta_name)
-                except UpdateFailed as err:
-                    err_str = str(err)
-                    if "HTTP 404" in err_str:
-                        _LOGGER.warning(
-                            "Account %s (%s) returned 404 - it may be archived or closed. "
-                            "Excluding from sensors. If this account no longer exists in PocketSmith, "
-                            "remove and re-add the integration to clear stale entities.",
-                            ta_id,
-                            ta_name,
-                        )
-                        inaccessible_ta_ids.add(ta_id)
-                    else:
-                        _LOGGER.warning(
-                            "Failed to fetch transactions for account %s (%s): %s", ta_id, ta_name, err
-                        )
-                        transactions_by_account[ta_id] = []
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to fetch transactions for account %s (%s): %s", ta_id, ta_name, err
+                ]
+            # Accounts with an open breaker wait for their backoff, unless
+            # they were requested explicitly
+            backing_off = [
+                ta["id"]
+                for ta in to_sync
+                if ta["id"] not in forced_accounts and not self.breaker.allow(ta["id"], now)
+            ]
+            if backing_off:
+                to_sync = [ta for ta in to_sync if ta["id"] not in backing_off]
+            _LOGGER.debug(
+                "Syncing transactions for %d of %d account(s), %d backing off",
+                len(to_sync),
+                len(transaction_accounts),
+                len(backing_off),
+            )
+
+            transactions_by_account = {}
+            database_writes: list[tuple[Any, list[Transaction], bool]] = []
+            # Events for new and changed transactions, fired once the sync
+            # is done
+            events: list[tuple[str, dict[str, Any]]] = []
+            if to_sync:
+                semaphore = asyncio.Semaphore(self.fetch_concurrency)
+                full_sync = TIER_TRANSACTIONS in due_tiers and (
+                    self._last_full_sync is None
+                    or now - self._last_full_sync >= FULL_SYNC_INTERVAL
+                )
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_account_transactions(ta, semaphore, full_sync)
+                        for ta in to_sync
                     )
-                    transactions_by_account[ta_id] = []
+                )
+                if full_sync:
+                    self._last_full_sync = now
+                for result in results:
+                    if result.transactions is None:
+                        self._inaccessible_ta_ids.add(result.ta_id)
+                        continue
+                    transactions_by_account[result.ta_id] = result.transactions
+                    if result.synced is not None:
+                        database_writes.append((result.ta_id, result.synced, result.replace))
+                    events.extend(result.events)
+
+            previous_transactions = previous.get("transactions", {})
+            for ta_id in current_ta_ids - self._inaccessible_ta_ids:
+                if ta_id not in transactions_by_account:
+                    transactions_by_account[ta_id] = previous_transactions.get(
+                        ta_id
+                    ) or self._sorted_transactions(ta_id)
+
+            # Drop in-memory state for accounts that are gone or no longer
+            # tracked. Their history stays in the database, which is only
+            # deleted with the config entry, so an account missing from one
+            # response or an account type unticked in options loses nothing.
+            removed_ta_ids = set(self._transaction_store) - current_ta_ids
+            for ta_id in removed_ta_ids:
+                self._transaction_store.pop(ta_id, None)
+                self._sync_cursors.pop(ta_id, None)
+                self._account_versions.pop(ta_id, None)
+                self.telemetry.forget({"transaction_accounts/{}/transactions".format(ta_id)})
+            self.breaker.forget(set(self.breaker.failing()) - current_ta_ids)
+
+            # The first refresh also writes accounts it did not sync, so the
+            # database holds everything the sensors do (e.g. after restoring
+            # a snapshot taken before the database existed)
+            if not self._database_seeded:
+                self._database_seeded = True
+                written = {ta_id for ta_id, _, _ in database_writes}
+                database_writes.extend(
+                    (ta_id, transactions, False)
+                    for ta_id, transactions in transactions_by_account.items()
+                    if ta_id not in written and transactions
+                )
+
+            if database_writes:
+                await self._async_write_database(database_writes)
+
+            for event_type, event_data in events:
+                self.hass.bus.async_fire(event_type, event_data)
 
             # Filter out inaccessible accounts from transaction_accounts so no
             # sensors are created/updated for them (avoids persistent 404 noise)
+            inaccessible_ta_ids = self._inaccessible_ta_ids & current_ta_ids
             active_transaction_accounts = [
                 ta for ta in transaction_accounts if ta["id"] not in inaccessible_ta_ids
             ]
@@ -114,18 +714,40 @@ class PocketSmithDataUpdateCoordinator(DataUpdateCoordinator):
             # Organize data
             data = {
                 "user": user_data,
-                "accounts": {account["id"]: account for account in accounts},
+                "accounts": accounts_by_id,
                 "transaction_accounts": {
                     ta["id"]: ta for ta in active_transaction_accounts
                 },
                 "transactions": transactions_by_account,
+                "categories": categories,
+                "stale_transactions": self._stale_transactions(),
             }
+            data["view"] = build_view(
+                data,
+                previous.get("view"),
+                self._spending_summary(data),
+                self._net_worth.update(
+                    user_data.get("base_currency_code"),
+                    data["transaction_accounts"],
+                    now,
+                ),
+            )
+
+            for tier in due_tiers:
+                self._tier_refreshed[tier] = now
+            updated_tiers = set(due_tiers)
+            if to_sync or data["stale_transactions"] != previous.get("stale_transactions"):
+                # New or changed accounts were synced outside the tier
+                # schedule, or an account's transactions became stale or fresh
+                updated_tiers.add(TIER_TRANSACTIONS)
+            self.updated_tiers = frozenset(updated_tiers)
 
             _LOGGER.debug("Successfully completed PocketSmith data fetch")
+            self._async_save_snapshot(data)
             return data
 
         except UpdateFailed:
-            # Re-raise UpdateFailed with original message
+            # Re-raise UpdateFailed (including RateLimited) with original message
             raise
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error communicating with PocketSmith API: %s", err, exc_info=True)
@@ -134,35 +756,608 @@ class PocketSmithDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Unexpected error during data fetch: %s", err, exc_info=True)
             raise UpdateFailed("Unexpected error: {}".format(err)) from err
 
+    def _spending_summary(self, data: dict[str, Any]) -> Mapping[Any, CategorySpending]:
+        """Update the spending totals and return the per-category summary.
+
+        Totals only cover the transactions held locally. An account holding
+        its full transactions_per_account is truncated, so spending is only
+        complete from the day after its oldest held transaction.
+        """
+        if self._category_tree.categories is not data["categories"]:
+            self._category_tree = CategoryTree(data["categories"])
+        self._spending.update(data["transactions"])
+
+        coverage_start = None
+        for transactions in data["transactions"].values():
+            if len(transactions) < self.transactions_per_account or not transactions:
+                continue
+            oldest = min((t.date for t in transactions if t.date), default=None)
+            if oldest is None:
+                continue
+            try:
+                covered = date.fromisoformat(oldest[:10]) + timedelta(days=1)
+            except ValueError:
+                continue
+            if coverage_start is None or covered > coverage_start:
+                coverage_start = covered
+
+        return self._spending.summary(
+            self._category_tree, dt_util.now().date(), coverage_start
+        )
+
+    def _tier_due(self, tier: str, now: datetime) -> bool:
+        """Return True if a tier's refresh interval has elapsed."""
+        if tier == TIER_METADATA and (self._user_data is None or not self._categories_fetched):
+            return True
+        refreshed = self._tier_refreshed.get(tier)
+        return refreshed is None or now - refreshed >= self.tier_intervals[tier]
+
+    @callback
+    def async_force_tiers(self, tiers: Iterable[str]) -> None:
+        """Fetch the given tiers on the next refresh even if they are not due."""
+        self._forced_tiers.update(tiers)
+
+    async def _async_refresh_user(self) -> None:
+        """Fetch /me and update the cached user id and profile."""
+        _LOGGER.debug("Fetching user information from /me")
+        user_data = await self._fetch_endpoint("me")
+        user_id = user_data.get("id")
+        _LOGGER.debug("Successfully fetched user data: %s (ID: %s)", user_data.get("login", "unknown"), user_id)
+        if user_id is None:
+            raise UpdateFailed("PocketSmith /me response did not include a user id")
+
+        self._user_data = user_data
+        if user_id != self.user_id:
+            self.user_id = user_id
+            self._async_store_user_id(user_id)
+
+    async def _async_try_refresh_user(self) -> None:
+        """Refresh the user profile, keeping the cached profile on failure."""
+        try:
+            await self._async_refresh_user()
+        except RateLimited as err:
+            _LOGGER.debug(
+                "Rate limited refreshing PocketSmith user profile, keeping cached "
+                "profile (retry after %.0fs)",
+                err.retry_after,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Failed to refresh PocketSmith user profile, keeping cached profile: %s",
+                err,
+            )
+
+    @callback
+    def _async_store_user_id(self, user_id: int) -> None:
+        """Persist the user id in the config entry so later setups skip /me."""
+        entry = self.hass.config_entries.async_get_entry(self.entry_id)
+        if entry is None or entry.data.get(CONF_USER_ID) == user_id:
+            return
+        self.hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_USER_ID: user_id}
+        )
+
+    async def _async_try_fetch_categories(self) -> dict[Any, dict[str, Any]] | None:
+        """Fetch and flatten the user's category tree, or return None on failure."""
+        _LOGGER.debug("Fetching categories from /users/%s/categories", self.user_id)
+        try:
+            tree = await self._fetch_endpoint("users/{}/categories".format(self.user_id))
+        except RateLimited as err:
+            _LOGGER.debug(
+                "Rate limited fetching PocketSmith categories, keeping cached "
+                "categories (retry after %.0fs)",
+                err.retry_after,
+            )
+            return None
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Failed to fetch PocketSmith categories, keeping cached categories: %s", err
+            )
+            return None
+        categories = flatten_categories(tree)
+        self._categories_fetched = True
+        _LOGGER.debug("Successfully fetched %d categories", len(categories))
+        return categories
+
+    async def _fetch_user_accounts(
+        self, include_accounts: bool
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+        """Fetch the transaction accounts (and optionally accounts) for the cached user id.
+
+        Returns (transaction_accounts, accounts); accounts is None when not requested.
+        """
+        user_id = self.user_id
+
+        accounts = None
+        if include_accounts:
+            # Fetch accounts using user ID
+            _LOGGER.debug("Fetching accounts from /users/%s/accounts", user_id)
+            accounts = await self._fetch_endpoint("users/{}/accounts".format(user_id))
+            _LOGGER.debug("Successfully fetched %d accounts", len(accounts))
+
+        # Fetch transaction accounts using user ID
+        _LOGGER.debug("Fetching transaction accounts from /users/%s/transaction_accounts", user_id)
+        transaction_accounts = await self._fetch_endpoint("users/{}/transaction_accounts".format(user_id))
+        _LOGGER.debug("Successfully fetched %d transaction accounts", len(transaction_accounts))
+
+        return transaction_accounts, accounts
+
+    async def _fetch_account_transactions(
+        self, ta: dict[str, Any], semaphore: asyncio.Semaphore, full_sync: bool
+    ) -> _AccountSync:
+        """Sync transactions for a single transaction account.
+
+        When a cursor exists for the account and no full sync is due, only
+        transactions updated since the cursor are requested and merged into
+        the locally held set. Otherwise the most recent transactions are
+        downloaded, until the per-account limit is reached, and replace the
+        local set. Either way the results are paginated and each page is
+        converted to compact records and dropped before the next is
+        requested. Every fetched transaction is written to the database, even
+        when it falls outside the trimmed in-memory window.
+
+        Returns the account's transactions, with the database write and the
+        events due if they were synced. transactions is None when the account
+        returned 404 and should be excluded. On any other error the previously
+        synced transactions are returned (or an empty list if there are none).
+        """
+        ta_id = ta["id"]
+        ta_name = ta.get("name", str(ta_id))
+        cursor = None if full_sync else self._sync_cursors.get(ta_id)
+
+        # A full sync stops at the per-account limit; an incremental one
+        # reads everything changed, in as few requests as possible
+        params: dict[str, Any] = {
+            "per_page": TRANSACTIONS_PAGE_SIZE
+            if cursor
+            else min(self.transactions_per_account, TRANSACTIONS_PAGE_SIZE)
+        }
+        if cursor:
+            params["updated_since"] = cursor
+        endpoint = "transaction_accounts/{}/transactions?{}".format(ta_id, urlencode(params))
+
+        # Work on a copy so a failure part-way through leaves the store intact
+        store = dict(self._transaction_store.get(ta_id, {})) if cursor else {}
+        new_cursor = self._sync_cursors.get(ta_id)
+        fetched = 0
+        # Everything this sync returned, including transactions older than
+        # the in-memory window, for the database
+        synced: dict[Any, Transaction] = {}
+
+        async with semaphore:
+            _LOGGER.debug(
+                "Fetching transactions for account %s (%s) %s",
+                ta_id,
+                ta_name,
+                "updated since {}".format(cursor) if cursor else "(full sync)",
+            )
+            try:
+                async with aclosing(self._iter_pages(endpoint, _parse_transaction)) as pages:
+                    async for page in pages:
+                        fetched += len(page)
+                        new_cursor = _merge_page(store, page, new_cursor)
+                        synced.update((transaction.id, transaction) for transaction in page)
+                        # Incremental syncs read every page, since the cursor
+                        # moves past whatever is left unread
+                        if not cursor and fetched >= self.transactions_per_account:
+                            break
+            except RateLimited as err:
+                _LOGGER.debug(
+                    "Rate limited fetching transactions for account %s (%s), "
+                    "keeping previously synced transactions (retry after %.0fs)",
+                    ta_id,
+                    ta_name,
+                    err.retry_after,
+                )
+                return _AccountSync(ta_id, self._sorted_transactions(ta_id))
+            except UpdateFailed as err:
+                err_str = str(err)
+                if "HTTP 404" in err_str:
+                    _LOGGER.warning(
+                        "Account %s (%s) returned 404 - it may be archived or closed. "
+                        "Removing its sensors; they are re-created automatically if the "
+                        "account becomes accessible again.",
+                        ta_id,
+                        ta_name,
+                    )
+                    self._transaction_store.pop(ta_id, None)
+                    self._sync_cursors.pop(ta_id, None)
+                    self._account_versions.pop(ta_id, None)
+                    self.breaker.record_success(ta_id)
+                    return _AccountSync(ta_id, None)
+                self._record_fetch_failure(ta_id, ta_name, err)
+                return _AccountSync(ta_id, self._sorted_transactions(ta_id))
+            except Exception as err:
+                self._record_fetch_failure(ta_id, ta_name, err)
+                return _AccountSync(ta_id, self._sorted_transactions(ta_id))
+
+        _LOGGER.debug("Fetched %d transactions for account %s (%s)", fetched, ta_id, ta_name)
+        previous = self._transaction_store.get(ta_id)
+        self._commit_transactions(ta_id, store, new_cursor)
+        self.breaker.record_success(ta_id)
+        self._account_versions[ta_id] = _account_version(ta)
+        # Without a cursor the account's recent window was downloaded in full
+        result = _AccountSync(
+            ta_id,
+            self._sorted_transactions(ta_id),
+            synced=list(synced.values()),
+            replace=cursor is None,
+        )
+        # An account's first sync only establishes what is already there
+        if previous is not None:
+            # Transactions older than the window are compared with their
+            # version in the database, so edits to them fire events too
+            known = {
+                transaction_id: previous[transaction_id]
+                for transaction_id in synced
+                if transaction_id in previous
+            }
+            known.update(
+                await self._async_read_database(
+                    ta_id, [t for t in synced if t not in previous]
+                )
+            )
+            oldest = None
+            if len(previous) >= self.transactions_per_account:
+                oldest = min(t.sort_key for t in previous.values())
+            result.events = transaction_events(
+                self.entry_id, ta, known, synced.values(), oldest
+            )
+        return result
+
+    def _record_fetch_failure(self, ta_id: Any, ta_name: str, err: Exception) -> None:
+        """Count a failed transaction fetch towards the account's breaker."""
+        retry_at = self.breaker.record_failure(ta_id, err, dt_util.utcnow())
+        if retry_at is None:
+            _LOGGER.warning(
+                "Failed to fetch transactions for account %s (%s): %s", ta_id, ta_name, err
+            )
+            return
+        _LOGGER.warning(
+            "Failed to fetch transactions for account %s (%s) %d times in a row: %s. "
+            "Keeping its last synced transactions and not retrying until %s",
+            ta_id,
+            ta_name,
+            self.breaker.get(ta_id).failures,
+            err,
+            retry_at.isoformat(timespec="seconds"),
+        )
+
+    def _stale_transactions(self) -> dict[Any, str | None]:
+        """Return the accounts whose last fetch failed, with their retry time."""
+        return {
+            ta_id: state.retry_at.isoformat() if state.retry_at else None
+            for ta_id, state in self.breaker.failing().items()
+        }
+
+    async def async_query_transactions(self, query: TransactionQuery) -> list[dict[str, Any]]:
+        """Query the local transaction database.
+
+        Category ids include their subcategories. Each result carries the
+        name of its account.
+        """
+        if query.category_ids:
+            query = replace(
+                query,
+                category_ids=tuple(self._category_tree.with_descendants(query.category_ids)),
+            )
+        rows = await self.hass.async_add_executor_job(self.database.query, query)
+        transaction_accounts = (self.data or {}).get("transaction_accounts", {})
+        for row in rows:
+            ta = transaction_accounts.get(row["account_id"])
+            row["account_name"] = ta.get("name") if ta else None
+        return rows
+
+    async def _async_read_database(
+        self, ta_id: Any, ids: list[Any]
+    ) -> dict[Any, Transaction]:
+        """Return the stored versions of an account's transactions by id."""
+        if not ids:
+            return {}
+        try:
+            return await self.hass.async_add_executor_job(self.database.get, ta_id, ids)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to read PocketSmith transactions from the local database: %s", err)
+            return {}
+
+    async def _async_write_database(
+        self, writes: list[tuple[Any, list[Transaction], bool]]
+    ) -> None:
+        """Write synced transactions to the local database in the executor."""
+        try:
+            await self.hass.async_add_executor_job(self.database.store, writes)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to write PocketSmith transactions to the local database: %s", err)
+
+    def _commit_transactions(
+        self, ta_id: Any, store: dict[Any, Transaction], cursor: str | None
+    ) -> None:
+        """Replace an account's local set and cursor after a successful sync.
+
+        The set is trimmed to the configured number of most recent
+        transactions per account.
+        """
+        if len(store) > self.transactions_per_account:
+            newest = sorted(store.values(), key=_transaction_sort_key, reverse=True)
+            store = {
+                transaction.id: transaction
+                for transaction in newest[: self.transactions_per_account]
+            }
+
+        self._transaction_store[ta_id] = store
+        if cursor:
+            self._sync_cursors[ta_id] = cursor
+
+    def _sorted_transactions(self, ta_id: Any) -> list[Transaction]:
+        """Return the locally held transactions for an account, newest first."""
+        return sorted(
+            self._transaction_store.get(ta_id, {}).values(),
+            key=_transaction_sort_key,
+            reverse=True,
+        )
+
+    def _conditional_headers(
+        self, endpoint: str
+    ) -> tuple[str, _CachedResponse | None, dict[str, str]]:
+        """Return (cache path, cached response, request headers) for an endpoint.
+
+        Validators (ETag / Last-Modified) from the previous response for the
+        same endpoint are added to the headers. Cache entries are keyed by
+        path so that a changing query string (e.g. a delta sync cursor)
+        replaces rather than accumulates entries.
+        """
+        path = endpoint.partition("?")[0]
+        cached = self._response_cache.get(path)
+        if cached is None or cached.endpoint != endpoint:
+            return path, None, self.headers
+
+        headers = dict(self.headers)
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return path, cached, headers
+
+    def _remember_response(
+        self, path: str, endpoint: str, response: aiohttp.ClientResponse, data: Any
+    ) -> None:
+        """Cache a decoded body if the response carried validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._response_cache[path] = _CachedResponse(
+                endpoint=endpoint,
+                etag=etag,
+                last_modified=last_modified,
+                data=data,
+            )
+        else:
+            self._response_cache.pop(path, None)
+
+    @asynccontextmanager
+    async def _request(
+        self, url: str, endpoint: str, headers: dict[str, str]
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a GET request and yield the response.
+
+        Requests are paced by the token bucket shared with every entry using
+        the same API key. A 429 pauses the bucket for Retry-After seconds and,
+        when the wait is short, the request is retried; otherwise RateLimited
+        is raised. While the bucket is paused for longer than
+        RATE_LIMIT_MAX_WAIT, every request raises RateLimited at once instead
+        of waiting for the pause to end.
+
+        Each attempt's status and latency (including reading the body, which
+        happens while the response is yielded) is recorded in telemetry.
+        """
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            if not await self.rate_limiter.acquire(RATE_LIMIT_MAX_WAIT):
+                retry_after = self.rate_limiter.paused_for()
+                _LOGGER.debug(
+                    "Not fetching %s, rate limited by PocketSmith for another %.0fs",
+                    endpoint,
+                    retry_after,
+                )
+                raise RateLimited(
+                    "Error fetching {}: rate limited by PocketSmith".format(endpoint),
+                    retry_after,
+                )
+            start = time.monotonic()
+            status = None
+            try:
+                async with self.session.get(
+                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    status = response.status
+                    _LOGGER.debug("Response status for %s: %s", endpoint, status)
+                    self.rate_limiter.update_from_headers(response.headers)
+
+                    if status == 429:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        delay = retry_after if retry_after is not None else RATE_LIMIT_DEFAULT_DELAY
+                        self.rate_limiter.defer(delay)
+                        if attempt < RATE_LIMIT_MAX_RETRIES and delay <= RATE_LIMIT_MAX_WAIT:
+                            _LOGGER.debug(
+                                "Rate limited fetching %s, retrying in %.1fs", endpoint, delay
+                            )
+                            continue
+                        _LOGGER.warning(
+                            "Rate limited by PocketSmith fetching %s (retry after %.0fs)",
+                            endpoint,
+                            delay,
+                        )
+                        raise RateLimited(
+                            "Error fetching {}: HTTP 429 (rate limited)".format(endpoint),
+                            delay,
+                        )
+
+                    yield response
+                    return
+            finally:
+                self.telemetry.record_request(endpoint, status, time.monotonic() - start)
+
+        # Not reached: the final attempt either yields or raises
+        raise RateLimited(
+            "Error fetching {}: HTTP 429 (rate limited)".format(endpoint),
+            self.rate_limiter.paused_for(),
+        )
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse, endpoint: str) -> None:
+        """Log and raise UpdateFailed for a non-200 response."""
+        status = response.status
+        response_text = await response.text()
+        _LOGGER.error(
+            "Error fetching %s: HTTP %s - %s", 
+            endpoint, 
+            status, 
+            response_text[:200]
+        )
+        raise UpdateFailed(
+            "Error fetching {}: HTTP {}".format(endpoint, status)
+        )
+
+    async def _read_json(self, response: aiohttp.ClientResponse, endpoint: str) -> Any:
+        """Read and decode a JSON response body, recording its size."""
+        body = await response.read()
+        self.telemetry.record_bytes(endpoint, len(body))
+        return self.json_decoder(body)
+
+    async def _read_array(
+        self,
+        response: aiohttp.ClientResponse,
+        endpoint: str,
+        convert: Callable[[Any], Any | None],
+    ) -> list[Any]:
+        """Read a JSON array body and convert its elements.
+
+        Bodies smaller than STREAM_MIN_BYTES are decoded in one call. Once a
+        body reaches that size the rest is decoded incrementally, holding
+        only one chunk and one decoded element at a time besides the
+        converted results. Elements converted to None are dropped.
+        """
+        parser = None
+        buffered: list[bytes] = []
+        items = []
+        size = 0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            if parser is None:
+                buffered.append(chunk)
+                if size < STREAM_MIN_BYTES:
+                    continue
+                parser = JSONArrayParser(self.json_decoder)
+                chunk = b"".join(buffered)
+                buffered = []
+            for element in parser.feed(chunk):
+                if (item := convert(element)) is not None:
+                    items.append(item)
+        self.telemetry.record_bytes(endpoint, size)
+
+        if parser is None:
+            elements = self.json_decoder(b"".join(buffered))
+            if not isinstance(elements, list):
+                raise ValueError(
+                    "Expected a JSON array, got {}".format(type(elements).__name__)
+                )
+        else:
+            elements = parser.close()
+        for element in elements:
+            if (item := convert(element)) is not None:
+                items.append(item)
+        return items
+
+    async def async_fetch_endpoint(self, endpoint: str) -> Any:
+        """Fetch an endpoint for another data source of this entry.
+
+        Requests share this coordinator's session, rate limiter, conditional
+        request cache and telemetry.
+        """
+        return await self._fetch_endpoint(endpoint)
+
     async def _fetch_endpoint(self, endpoint: str) -> Any:
-        """Fetch data from a specific endpoint."""
-        url = "{}/{}".format(API_BASE_URL, endpoint)
+        """Fetch data from a specific endpoint.
+
+        A 304 Not Modified response to a conditional request returns the
+        previously decoded body without downloading or parsing it.
+        """
+        url = "{}/{}".format(self.base_url, endpoint)
         
         _LOGGER.debug("Fetching endpoint: %s", url)
 
+        path, cached, headers = self._conditional_headers(endpoint)
+
         try:
-            async with self.session.get(
-                url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                status = response.status
-                _LOGGER.debug("Response status for %s: %s", endpoint, status)
-                
-                if status != 200:
-                    response_text = await response.text()
-                    _LOGGER.error(
-                        "Error fetching %s: HTTP %s - %s", 
-                        endpoint, 
-                        status, 
-                        response_text[:200]
-                    )
-                    raise UpdateFailed(
-                        "Error fetching {}: HTTP {}".format(endpoint, status)
-                    )
-                
-                data = await response.json()
+            async with self._request(url, endpoint, headers) as response:
+                if response.status == 304 and cached is not None:
+                    _LOGGER.debug("%s not modified, using cached response", endpoint)
+                    return cached.data
+
+                if response.status != 200:
+                    await self._raise_for_status(response, endpoint)
+
+                data = await self._read_json(response, endpoint)
                 _LOGGER.debug("Successfully parsed JSON from %s", endpoint)
+                self._remember_response(path, endpoint, response, data)
                 return data
                 
+        except RateLimited:
+            # Already logged by _request
+            raise
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error fetching %s: %s", endpoint, err)
+            raise
+        except Exception as err:
+            _LOGGER.error("Unexpected error fetching %s: %s", endpoint, err, exc_info=True)
+            raise
+
+    async def _iter_pages(
+        self, endpoint: str, convert: Callable[[Any], Any | None]
+    ) -> AsyncIterator[list[Any]]:
+        """Yield each page of a paginated list endpoint in turn.
+
+        Follows the Link rel="next" header, falling back to requesting the
+        next page number until the Total header's count of elements has been
+        received, so callers can process and drop each page instead of
+        holding the whole result in memory. Each page is yielded as the
+        list of its converted elements, large pages being decoded
+        incrementally.
+        The first request is sent conditionally; a 304 yields the cached
+        single page.
+        """
+        url: str | None = "{}/{}".format(self.base_url, endpoint)
+        path, cached, headers = self._conditional_headers(endpoint)
+        page_number = 1
+        received = 0
+
+        try:
+            while url is not None:
+                _LOGGER.debug("Fetching page %d of %s", page_number, endpoint)
+                async with self._request(url, endpoint, headers) as response:
+                    if response.status == 304 and cached is not None:
+                        _LOGGER.debug("%s not modified, using cached response", endpoint)
+                        page = cached.data
+                        url = None
+                    else:
+                        if response.status != 200:
+                            await self._raise_for_status(response, endpoint)
+                        page = await self._read_array(response, endpoint, convert)
+                        received += len(page)
+                        url = _next_page_url(response, page_number, len(page), received)
+                        if page_number == 1:
+                            if url is None:
+                                self._remember_response(path, endpoint, response, page)
+                            else:
+                                self._response_cache.pop(path, None)
+
+                # Validators only apply to the first page
+                headers = self.headers
+                page_number += 1
+                yield page
+
+        except RateLimited:
+            # Already logged by _request
+            raise
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error fetching %s: %s", endpoint, err)
             raise
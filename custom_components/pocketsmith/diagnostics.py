@@ -0,0 +1,51 @@
+"""Diagnostics support for PocketSmith."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import PocketSmithDataUpdateCoordinator
+
+TO_REDACT = {CONF_API_KEY, CONF_USERNAME, "email", "login", "name", "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Account and transaction data is summarised as counts only.
+    """
+    coordinator: PocketSmithDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval_s": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "tier_intervals_s": {
+                tier: interval.total_seconds()
+                for tier, interval in coordinator.tier_intervals.items()
+            },
+            "fetch_concurrency": coordinator.fetch_concurrency,
+            "transactions_per_account": coordinator.transactions_per_account,
+            "account_types": sorted(coordinator.account_types)
+            if coordinator.account_types
+            else None,
+            "accounts": len(data.get("accounts", {})),
+            "transaction_accounts": len(data.get("transaction_accounts", {})),
+            "transactions": sum(
+                len(transactions) for transactions in data.get("transactions", {}).values()
+            ),
+        },
+        "account_failures": coordinator.breaker.as_dict(),
+        "telemetry": coordinator.telemetry.as_dict(),
+    }
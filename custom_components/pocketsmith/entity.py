@@ -0,0 +1,76 @@
+"""Base entity for the PocketSmith integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import TIER_BALANCES, PocketSmithDataUpdateCoordinator
+from .models import PocketSmithView
+
+
+class PocketSmithEntity(CoordinatorEntity):
+    """Base class for PocketSmith entities.
+
+    Each entity declares the coordinator tiers it reads in _tiers, and only
+    writes its state when one of those tiers was refreshed by the latest
+    update (or when its availability changed). Even then the write is
+    skipped if the state, icon and attributes are identical to the last
+    ones written, so unchanged data adds no recorder rows.
+    """
+
+    _tiers: frozenset[str] = frozenset({TIER_BALANCES})
+
+    def __init__(self, coordinator: PocketSmithDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_available: bool | None = None
+        self._last_written: tuple[Any, ...] | None = None
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return everything this entity exposes, for change detection."""
+        if not self.available:
+            return (False,)
+        return (True, self.state, self.icon, self.extra_state_attributes)
+
+    async def async_added_to_hass(self) -> None:
+        """Record the initially written state."""
+        await super().async_added_to_hass()
+        self._last_available = self.available
+        self._last_written = self._state_fingerprint()
+
+    @property
+    def view(self) -> PocketSmithView:
+        """Return the derived view built by the latest refresh."""
+        return self.coordinator.data["view"]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if a subscribed tier changed and the state differs."""
+        available = self.available
+        if available == self._last_available and not (
+            self.coordinator.updated_tiers & self._tiers
+        ):
+            return
+        self._last_available = available
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_written:
+            return
+        self._last_written = fingerprint
+        super()._handle_coordinator_update()
+
+
+class PocketSmithBudgetEntity(CoordinatorEntity):
+    """Base class for entities reading the budget coordinator.
+
+    These entities are disabled by default; the budget summary is only
+    fetched once one of them has been enabled.
+    """
+
+    _attr_entity_registry_enabled_default = False
+
+    async def async_added_to_hass(self) -> None:
+        """Fetch the budget summary if this is the first entity to need it."""
+        await super().async_added_to_hass()
+        self.hass.async_create_task(self.coordinator.async_ensure_data())
@@ -0,0 +1,72 @@
+"""Events fired for new and changed PocketSmith transactions."""
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+from .models import Transaction
+
+EVENT_NEW_TRANSACTION = "pocketsmith_new_transaction"
+EVENT_TRANSACTION_CHANGED = "pocketsmith_transaction_changed"
+
+# Fields whose change fires EVENT_TRANSACTION_CHANGED. updated_at alone is
+# not a change, and category_title follows category_id.
+_TRACKED_FIELDS = ("date", "payee", "amount", "memo", "category_id")
+
+
+def _payload(
+    entry_id: str, ta: Mapping[str, Any], transaction: Transaction
+) -> dict[str, Any]:
+    """Return the event data describing a transaction."""
+    return {
+        "entry_id": entry_id,
+        "account_id": ta["id"],
+        "account_name": ta.get("name"),
+        "transaction_id": transaction.id,
+        "date": transaction.date,
+        "payee": transaction.payee,
+        "amount": transaction.amount,
+        "amount_in_base_currency": transaction.amount_in_base_currency,
+        "currency_code": (ta.get("currency_code") or "").upper() or None,
+        "category_id": transaction.category_id,
+        "category_title": transaction.category_title,
+    }
+
+
+def transaction_events(
+    entry_id: str,
+    ta: Mapping[str, Any],
+    previous: Mapping[Any, Transaction],
+    fetched: Iterable[Transaction],
+    oldest: tuple[str, int] | None,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Diff an account's fetched transactions and return the events to fire.
+
+    previous maps transaction id to the version held before the sync, from
+    the in-memory window or the database. When the window was trimmed to
+    the per-account limit, oldest is the sort key of its oldest transaction:
+    unknown transactions older than that had been trimmed, not added, and
+    are skipped.
+    """
+    events = []
+    for transaction in fetched:
+        before = previous.get(transaction.id)
+        if before is None:
+            if oldest is None or transaction.sort_key >= oldest:
+                events.append((EVENT_NEW_TRANSACTION, _payload(entry_id, ta, transaction)))
+            continue
+
+        changes = [
+            field
+            for field in _TRACKED_FIELDS
+            if getattr(before, field) != getattr(transaction, field)
+        ]
+        if not changes:
+            continue
+        payload = _payload(entry_id, ta, transaction)
+        payload["changes"] = changes
+        payload["recategorized"] = "category_id" in changes
+        if payload["recategorized"]:
+            payload["previous_category_id"] = before.category_id
+            payload["previous_category_title"] = before.category_title
+        events.append((EVENT_TRANSACTION_CHANGED, payload))
+    return events
@@ -0,0 +1,99 @@
+"""Incremental decoding of JSON array responses.
+
+Transaction pages are arrays of large objects (every transaction embeds its
+account, institution and category). Decoding the whole body at once holds
+the raw bytes and every decoded object in memory together. JSONArrayParser
+instead splits the array into its elements as the bytes arrive and decodes
+each with the given decoder, so callers can convert and drop each element
+before the next is decoded.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable
+
+# Candidate ends of an array element: a closing brace followed by a comma
+# and the next object, or by the closing bracket. Braces inside strings or
+# nested arrays can match too; such candidates fail to decode and are skipped.
+_ELEMENT_END = re.compile(rb"}(\s*,\s*(?={)|\s*\])")
+_ARRAY_START = re.compile(rb"\s*\[\s*")
+_EMPTY_END = re.compile(rb"\]\s*")
+
+
+class JSONArrayParser:
+    """Push parser yielding the elements of a top-level JSON array of objects.
+
+    Feed the body in chunks of any size and call close() at the end. A body
+    that is not an array of objects is decoded whole by close(), so any
+    valid JSON array is accepted.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any]) -> None:
+        """Initialize with the decoder used for each element."""
+        self._loads = loads
+        self._buffer = b""
+        # Offset of the current element, None until the opening bracket
+        self._start: int | None = None
+        # Offset from which to look for the current element's end
+        self._searched = 0
+        self._done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of the body and return the elements it completed."""
+        if self._done:
+            return []
+        if self._start:
+            # Drop the elements already returned
+            self._buffer = self._buffer[self._start :] + chunk
+            self._searched -= self._start
+            self._start = 0
+        else:
+            self._buffer += chunk
+
+        if self._start is None:
+            match = _ARRAY_START.match(self._buffer)
+            if match is None or match.end() == len(self._buffer):
+                # Not enough data yet, or not an array (left to close())
+                return []
+            self._start = self._searched = match.end()
+            if _EMPTY_END.match(self._buffer, self._start):
+                self._done = True
+                return []
+
+        elements = []
+        buffer = self._buffer
+        while True:
+            match = _ELEMENT_END.search(buffer, self._searched)
+            if match is None:
+                # Only the last brace can still turn out to end an element
+                self._searched = max(self._start, buffer.rfind(b"}", self._start))
+                break
+            try:
+                element = self._loads(buffer[self._start : match.start() + 1])
+            except ValueError:
+                self._searched = match.start() + 1
+                continue
+            elements.append(element)
+            self._start = self._searched = match.end()
+            if match.group(1).endswith(b"]"):
+                self._done = True
+                break
+        return elements
+
+    def close(self) -> list[Any]:
+        """Return the elements left at the end of the body.
+
+        Raises ValueError if the remaining data is not valid JSON or the
+        body was not an array.
+        """
+        if self._done:
+            return []
+        if self._start is None:
+            value = self._loads(self._buffer)
+        else:
+            value = self._loads(b"[" + self._buffer[self._start :])
+        self._buffer = b""
+        self._done = True
+        if not isinstance(value, list):
+            raise ValueError("Expected a JSON array, got {}".format(type(value).__name__))
+        return value
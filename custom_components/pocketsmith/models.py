@@ -0,0 +1,314 @@
+"""Derived, read-only views of PocketSmith coordinator data."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from homeassistant.util import dt as dt_util
+
+from .const import CURRENCY_SYMBOLS
+
+if TYPE_CHECKING:
+    from .net_worth import NetWorth
+    from .spending import CategorySpending
+
+# Threshold in hours after which a feed is considered stale
+FEED_STALE_HOURS = 24
+
+
+def is_feed_account(ta: Mapping[str, Any]) -> bool:
+    """Return True if this transaction account is connected via a live data feed."""
+    return (
+        not ta.get("offline", True)
+        and ta.get("data_feeds_connection_id") is not None
+    )
+
+
+def parse_iso(ts: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp string to an aware datetime, or return None."""
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+
+def hours_since(ts: str | None) -> float | None:
+    """Return decimal hours elapsed since an ISO 8601 timestamp, or None."""
+    dt = parse_iso(ts)
+    if dt is None:
+        return None
+    delta = dt_util.now() - dt
+    return round(delta.total_seconds() / 3600, 1)
+
+
+def derive_feed_status(ta: Mapping[str, Any]) -> str:
+    """Derive a feed health status from the available API fields.
+
+    The PocketSmith API does not expose a feed_status field directly.
+    We infer status from:
+      - offline: True  → not a feed account, should not be called
+      - updated_at staleness → 'active' if recent, 'stale' if > FEED_STALE_HOURS
+    """
+    if not is_feed_account(ta):
+        return "offline"
+
+    hours = hours_since(ta.get("updated_at"))
+    if hours is None:
+        return "unknown"
+    if hours > FEED_STALE_HOURS:
+        return "stale"
+    return "active"
+
+
+def _intern(value: Any) -> str | None:
+    """Intern a frequently repeated string (payees, category titles)."""
+    if not value:
+        return None
+    return sys.intern(str(value))
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    """Compact record of one PocketSmith transaction.
+
+    API responses embed the full transaction account, institution and
+    category objects in every transaction. Only the fields the integration
+    uses are kept, with repeated strings interned.
+    """
+
+    id: int
+    amount: float | None
+    amount_in_base_currency: float | None
+    payee: str | None
+    date: str | None
+    memo: str | None
+    category_id: int | None
+    category_title: str | None
+    updated_at: str | None
+
+    @classmethod
+    def from_api(cls, transaction: Mapping[str, Any]) -> Transaction:
+        """Create a record from a transaction returned by the API."""
+        category = transaction.get("category")
+        category_id = None
+        category_title = None
+        if isinstance(category, dict):
+            category_id = category.get("id")
+            category_title = category.get("title")
+        return cls(
+            id=transaction["id"],
+            amount=transaction.get("amount"),
+            amount_in_base_currency=transaction.get("amount_in_base_currency"),
+            payee=_intern(transaction.get("payee")),
+            date=transaction.get("date"),
+            memo=transaction.get("memo") or None,
+            category_id=category_id,
+            category_title=_intern(category_title),
+            updated_at=transaction.get("updated_at"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Transaction:
+        """Create a record from the output of as_dict()."""
+        return cls(
+            id=data["id"],
+            amount=data.get("amount"),
+            amount_in_base_currency=data.get("amount_in_base_currency"),
+            payee=_intern(data.get("payee")),
+            date=data.get("date"),
+            memo=data.get("memo"),
+            category_id=data.get("category_id"),
+            category_title=_intern(data.get("category_title")),
+            updated_at=data.get("updated_at"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable dict of this record."""
+        return {
+            "id": self.id,
+            "amount": self.amount,
+            "amount_in_base_currency": self.amount_in_base_currency,
+            "payee": self.payee,
+            "date": self.date,
+            "memo": self.memo,
+            "category_id": self.category_id,
+            "category_title": self.category_title,
+            "updated_at": self.updated_at,
+        }
+
+    @property
+    def is_uncategorized(self) -> bool:
+        """Return True if the transaction has no category title."""
+        return not self.category_title
+
+    @property
+    def sort_key(self) -> tuple[str, int]:
+        """Sort key ordering transactions by date, then id."""
+        return (self.date or "", self.id if isinstance(self.id, int) else 0)
+
+
+@dataclass(frozen=True, slots=True)
+class AccountView:
+    """Everything the sensors expose about one transaction account.
+
+    Built once per refresh so entity properties only read fields.
+    """
+
+    ta_id: Any
+    raw: Mapping[str, Any]
+    name: str | None
+    display_name: str
+    institution_name: str | None
+    currency_code: str | None
+    currency_symbol: str | None
+    is_feed: bool
+    feed_status: str
+    hours_since_refresh: int | None
+    transactions: tuple[Transaction, ...]
+    uncategorized_ids: tuple[Any, ...]
+    uncategorized_count: int
+    transactions_updated_at: str | None
+    # True when the latest fetch of the account's transactions failed and
+    # the last synced ones are shown; retry_at is set while it is backing off
+    transactions_stale: bool = False
+    transactions_retry_at: str | None = None
+    # The coordinator list the transactions came from; an unchanged (carried
+    # forward) list lets the next view reuse the derived fields
+    source: list[Transaction] = field(compare=False, repr=False, default_factory=list)
+
+    @property
+    def institution_label(self) -> str:
+        """Return the institution name, or 'Unknown' when not available."""
+        return self.institution_name or "Unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class PocketSmithView:
+    """Immutable derived view of one refresh, keyed by transaction account id."""
+
+    accounts: Mapping[Any, AccountView]
+    uncategorized_total: int
+    transactions_updated_at: str | None
+    # Spending per top-level category, keyed by category id
+    spending: Mapping[Any, CategorySpending] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    net_worth: NetWorth | None = None
+
+    def account(self, ta_id: Any) -> AccountView | None:
+        """Return the view for a transaction account, if present."""
+        return self.accounts.get(ta_id)
+
+
+def _latest_timestamp(timestamps: Iterable[str | None]) -> str | None:
+    """Return the latest of a set of ISO 8601 timestamps, or None."""
+    latest = None
+    latest_parsed = None
+    for ts in timestamps:
+        parsed = parse_iso(ts)
+        if parsed is not None and (latest_parsed is None or parsed > latest_parsed):
+            latest, latest_parsed = ts, parsed
+    return latest
+
+
+def _institution_name(ta: Mapping[str, Any]) -> str | None:
+    """Return the institution title from a dict or plain value."""
+    institution_data = ta.get("institution", {})
+    if isinstance(institution_data, dict):
+        return institution_data.get("title")
+    return str(institution_data) if institution_data else None
+
+
+def build_account_view(
+    ta_id: Any,
+    ta: Mapping[str, Any],
+    transactions: list[Transaction],
+    previous: AccountView | None = None,
+    stale: bool = False,
+    retry_at: str | None = None,
+) -> AccountView:
+    """Build the view for one transaction account.
+
+    Transaction-derived fields are reused from the previous view when the
+    transaction list is unchanged.
+    """
+    currency_code = ta.get("currency_code")
+    currency_symbol = None
+    if currency_code:
+        currency_symbol = CURRENCY_SYMBOLS.get(currency_code.upper())
+
+    # Whole hours, so the Feed Status attributes change at most once an hour
+    # instead of on every poll
+    refreshed_at = parse_iso(ta.get("updated_at"))
+    hours_since_refresh = None
+    if refreshed_at is not None:
+        hours_since_refresh = int((dt_util.now() - refreshed_at).total_seconds() // 3600)
+
+    if previous is not None and previous.source is transactions:
+        transactions_tuple = previous.transactions
+        uncategorized_ids = previous.uncategorized_ids
+        uncategorized_count = previous.uncategorized_count
+        transactions_updated_at = previous.transactions_updated_at
+    else:
+        transactions_tuple = tuple(transactions)
+        uncategorized_ids = tuple(t.id for t in transactions_tuple if t.is_uncategorized)
+        uncategorized_count = len(uncategorized_ids)
+        transactions_updated_at = _latest_timestamp(t.updated_at for t in transactions_tuple)
+
+    return AccountView(
+        ta_id=ta_id,
+        raw=MappingProxyType(ta),
+        name=ta.get("name"),
+        display_name=ta.get("name", "Account {}".format(ta_id)),
+        institution_name=_intern(_institution_name(ta)),
+        currency_code=currency_code,
+        currency_symbol=currency_symbol,
+        is_feed=is_feed_account(ta),
+        feed_status=derive_feed_status(ta),
+        hours_since_refresh=hours_since_refresh,
+        transactions=transactions_tuple,
+        uncategorized_ids=uncategorized_ids,
+        uncategorized_count=uncategorized_count,
+        transactions_updated_at=transactions_updated_at,
+        transactions_stale=stale,
+        transactions_retry_at=retry_at,
+        source=transactions,
+    )
+
+
+def build_view(
+    data: Mapping[str, Any],
+    previous: PocketSmithView | None = None,
+    spending: Mapping[Any, CategorySpending] | None = None,
+    net_worth: NetWorth | None = None,
+) -> PocketSmithView:
+    """Build the derived view for a coordinator data payload."""
+    transaction_accounts = data.get("transaction_accounts", {})
+    transactions_by_account = data.get("transactions", {})
+    stale_transactions = data.get("stale_transactions", {})
+
+    accounts: dict[Any, AccountView] = {}
+    for ta_id, ta in transaction_accounts.items():
+        accounts[ta_id] = build_account_view(
+            ta_id,
+            ta,
+            transactions_by_account.get(ta_id, []),
+            previous.account(ta_id) if previous else None,
+            ta_id in stale_transactions,
+            stale_transactions.get(ta_id),
+        )
+
+    return PocketSmithView(
+        accounts=MappingProxyType(accounts),
+        uncategorized_total=sum(view.uncategorized_count for view in accounts.values()),
+        transactions_updated_at=_latest_timestamp(
+            view.transactions_updated_at for view in accounts.values()
+        ),
+        spending=spending if spending is not None else MappingProxyType({}),
+        net_worth=net_worth,
+    )
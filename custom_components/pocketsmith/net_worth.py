@@ -0,0 +1,195 @@
+"""Net worth across transaction accounts, converted to the base currency."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# How long an exchange rate taken from the account payloads is used before
+# it is replaced by the rate in the latest payload
+EXCHANGE_RATE_TTL = timedelta(hours=6)
+
+
+def _payload_rate(ta: Mapping[str, Any]) -> float | None:
+    """Return the account currency -> base currency rate implied by a payload.
+
+    The ratio of current_balance_in_base_currency to current_balance is
+    preferred; current_balance_exchange_rate is used when the balance is zero.
+    """
+    balance = ta.get("current_balance")
+    in_base = ta.get("current_balance_in_base_currency")
+    try:
+        if balance and in_base is not None:
+            return float(in_base) / float(balance)
+        rate = ta.get("current_balance_exchange_rate")
+        return float(rate) if rate else None
+    except (TypeError, ValueError):
+        return None
+
+
+class ExchangeRateCache:
+    """Exchange rates to the base currency, each kept for EXCHANGE_RATE_TTL."""
+
+    def __init__(self, ttl: timedelta = EXCHANGE_RATE_TTL) -> None:
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self._rates: dict[str, tuple[float, datetime]] = {}
+
+    def rate(self, currency: str) -> float | None:
+        """Return the cached rate for a currency."""
+        cached = self._rates.get(currency)
+        return cached[0] if cached else None
+
+    def update(
+        self, base_currency: str, transaction_accounts: Mapping[Any, Mapping[str, Any]], now: datetime
+    ) -> bool:
+        """Refresh expired or missing rates from the account payloads.
+
+        Returns True if any cached rate was replaced.
+        """
+        changed = False
+        for ta in transaction_accounts.values():
+            currency = (ta.get("currency_code") or "").upper()
+            if not currency or currency == base_currency:
+                continue
+            cached = self._rates.get(currency)
+            if cached is not None and now - cached[1] < self.ttl:
+                continue
+            rate = _payload_rate(ta)
+            if rate is None:
+                continue
+            self._rates[currency] = (rate, now)
+            changed = True
+        return changed
+
+    def updated_at(self) -> datetime | None:
+        """Return when the oldest cached rate was taken."""
+        return min((fetched for _, fetched in self._rates.values()), default=None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable copy for the snapshot."""
+        return {
+            currency: {"rate": rate, "updated_at": fetched.isoformat()}
+            for currency, (rate, fetched) in self._rates.items()
+        }
+
+    def restore(self, stored: Mapping[str, Any]) -> None:
+        """Load rates saved with as_dict()."""
+        for currency, item in stored.items():
+            try:
+                self._rates[currency] = (
+                    float(item["rate"]),
+                    datetime.fromisoformat(item["updated_at"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def rates(self) -> dict[str, float]:
+        """Return the cached rates by currency."""
+        return {currency: round(rate, 6) for currency, (rate, _) in sorted(self._rates.items())}
+
+
+@dataclass(frozen=True, slots=True)
+class NetWorth:
+    """Net worth of one entry in the base currency."""
+
+    currency: str | None
+    total: float
+    assets: float
+    liabilities: float
+    account_count: int
+    by_currency: Mapping[str, float]
+    exchange_rates: Mapping[str, float]
+    rates_updated_at: datetime | None
+    unconverted_accounts: tuple[str, ...]
+
+
+class NetWorthCalculator:
+    """Net worth maintained per account.
+
+    Each account's converted balance is kept with the inputs it was computed
+    from; a refresh only converts accounts whose balance, currency or rate
+    changed and rebuilds the result only if something did.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no accounts."""
+        self.rates = ExchangeRateCache()
+        # ta_id -> (inputs, currency, converted balance or None, name)
+        self._accounts: dict[Any, tuple[tuple[Any, ...], str, float | None, str]] = {}
+        self._base_currency: str | None = None
+        self._result: NetWorth | None = None
+
+    def update(
+        self,
+        base_currency: str | None,
+        transaction_accounts: Mapping[Any, Mapping[str, Any]],
+        now: datetime,
+    ) -> NetWorth:
+        """Bring the net worth in line with the latest balances."""
+        base = (base_currency or "").upper()
+        changed = base != self._base_currency
+        self._base_currency = base
+        changed |= self.rates.update(base, transaction_accounts, now)
+
+        for ta_id in set(self._accounts) - set(transaction_accounts):
+            del self._accounts[ta_id]
+            changed = True
+
+        for ta_id, ta in transaction_accounts.items():
+            currency = (ta.get("currency_code") or base).upper()
+            rate = 1.0 if currency == base else self.rates.rate(currency)
+            inputs = (ta.get("current_balance"), currency, rate, base)
+            previous = self._accounts.get(ta_id)
+            if previous is not None and previous[0] == inputs:
+                continue
+
+            converted = None
+            try:
+                balance = float(ta.get("current_balance") or 0)
+            except (TypeError, ValueError):
+                balance = None
+            if balance is not None and rate is not None:
+                converted = balance * rate
+            self._accounts[ta_id] = (
+                inputs,
+                currency,
+                converted,
+                ta.get("name") or str(ta_id),
+            )
+            changed = True
+
+        if changed or self._result is None:
+            self._result = self._build()
+        return self._result
+
+    def _build(self) -> NetWorth:
+        """Sum the converted balances."""
+        assets = 0.0
+        liabilities = 0.0
+        by_currency: dict[str, float] = {}
+        unconverted = []
+        for _, currency, converted, name in self._accounts.values():
+            if converted is None:
+                unconverted.append(name)
+                continue
+            if converted >= 0:
+                assets += converted
+            else:
+                liabilities -= converted
+            by_currency[currency] = by_currency.get(currency, 0.0) + converted
+
+        return NetWorth(
+            currency=self._base_currency or None,
+            total=round(assets - liabilities, 2),
+            assets=round(assets, 2),
+            liabilities=round(liabilities, 2),
+            account_count=len(self._accounts) - len(unconverted),
+            by_currency=MappingProxyType(
+                {currency: round(amount, 2) for currency, amount in sorted(by_currency.items())}
+            ),
+            exchange_rates=MappingProxyType(self.rates.rates()),
+            rates_updated_at=self.rates.updated_at(),
+            unconverted_accounts=tuple(sorted(unconverted)),
+        )
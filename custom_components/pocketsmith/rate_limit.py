@@ -0,0 +1,143 @@
+"""Client-side rate limiting for the PocketSmith API."""
+from __future__ import annotations
+
+import asyncio
+from email.utils import parsedate_to_datetime
+import hashlib
+import logging
+import time
+from typing import Mapping
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_RATE_LIMITERS = "{}_rate_limiters".format(DOMAIN)
+
+# Token bucket defaults. The burst covers a cold refresh of dozens of
+# accounts fetched concurrently (one request each, plus the account and
+# category lists) without pacing; sustained traffic beyond it, such as
+# several entries sharing a key or a service called in a loop, is paced.
+DEFAULT_BUCKET_CAPACITY = 60
+DEFAULT_REFILL_RATE = 5.0  # tokens per second
+
+
+class TokenBucket:
+    """Token bucket shared by every request made with one API key.
+
+    Besides pacing requests, the bucket can be paused until a point in time
+    when the server asks us to back off (429 Retry-After or an exhausted
+    rate-limit window).
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_BUCKET_CAPACITY,
+        refill_rate: float = DEFAULT_REFILL_RATE,
+    ) -> None:
+        """Initialize the bucket full."""
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+            self._updated = now
+
+    async def acquire(self, max_wait: float | None = None) -> bool:
+        """Wait until a request may be sent, then consume a token.
+
+        Returns False without waiting or consuming a token if the bucket is
+        paused for longer than max_wait seconds.
+        """
+        # The lock makes waiters queue in order instead of racing for tokens
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    if max_wait is not None and self._blocked_until - now > max_wait:
+                        return False
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+
+    def paused_for(self) -> float:
+        """Return the seconds left until a pause ends, or 0 if not paused."""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def defer(self, seconds: float) -> None:
+        """Pause all requests for the given number of seconds."""
+        if seconds <= 0:
+            return
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Back off when the server reports the rate-limit window is exhausted."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            if int(remaining) > 0:
+                return
+        except ValueError:
+            return
+        delay = parse_reset(headers.get("X-RateLimit-Reset"))
+        if delay is not None:
+            _LOGGER.debug("PocketSmith rate limit exhausted, pausing for %.1fs", delay)
+            self.defer(delay)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt_util.UTC)
+    return max(0.0, (when - dt_util.utcnow()).total_seconds())
+
+
+def parse_reset(value: str | None) -> float | None:
+    """Parse an X-RateLimit-Reset header into seconds from now.
+
+    Accepts either seconds until reset or a Unix timestamp.
+    """
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Values that look like epoch seconds are absolute times
+    if reset > 1_000_000_000:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+def async_get_rate_limiter(hass: HomeAssistant, api_key: str) -> TokenBucket:
+    """Return the token bucket shared by all config entries using this API key."""
+    limiters: dict[str, TokenBucket] = hass.data.setdefault(DATA_RATE_LIMITERS, {})
+    key = hashlib.sha256(api_key.encode()).hexdigest()
+    if key not in limiters:
+        limiters[key] = TokenBucket()
+    return limiters[key]
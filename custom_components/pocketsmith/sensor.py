@@ -1,72 +1,37 @@
 """Support for PocketSmith sensors."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import logging
+from typing import Any, Iterable
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, CURRENCY_SYMBOLS
-from .coordinator import PocketSmithDataUpdateCoordinator
-
-# Threshold in hours after which a feed is considered stale
-FEED_STALE_HOURS = 24
-
-
-def _is_feed_account(ta: dict) -> bool:
-    """Return True if this transaction account is connected via a live data feed."""
-    return (
-        not ta.get("offline", True)
-        and ta.get("data_feeds_connection_id") is not None
-    )
-
-
-def _parse_iso(ts: str | None) -> datetime | None:
-    """Parse an ISO 8601 timestamp string to an aware datetime, or return None."""
-    if not ts:
-        return None
-    try:
-        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    except (ValueError, TypeError):
-        return None
-
-
-def _hours_since(ts: str | None) -> float | None:
-    """Return decimal hours elapsed since an ISO 8601 timestamp, or None."""
-    dt = _parse_iso(ts)
-    if dt is None:
-        return None
-    delta = dt_util.now() - dt
-    return round(delta.total_seconds() / 3600, 1)
-
-
-def _derive_feed_status(ta: dict) -> str:
-    """Derive a feed health status from the available API fields.
+from .const import DOMAIN
+from .coordinator import (
+    TIER_BALANCES,
+    TIER_METADATA,
+    TIER_TRANSACTIONS,
+    PocketSmithDataUpdateCoordinator,
+)
+from .budget import BUDGET_EXPENSE, BUDGET_INCOME, PocketSmithBudgetCoordinator
+from .entity import PocketSmithBudgetEntity, PocketSmithEntity
+from .spending import PERIOD_MONTH, PERIOD_ROLLING
 
-    The PocketSmith API does not expose a feed_status field directly.
-    We infer status from:
-      - offline: True  → not a feed account, should not be called
-      - updated_at staleness → 'active' if recent, 'stale' if > FEED_STALE_HOURS
-    """
-    if not _is_feed_account(ta):
-        return "offline"
+_LOGGER = logging.getLogger(__name__)
 
-    hours = _hours_since(ta.get("updated_at"))
-    if hours is None:
-        return "unknown"
-    if hours > FEED_STALE_HOURS:
-        return "stale"
-    return "active"
+# Most recent transactions listed in a history sensor's attributes; the
+# full set is returned by the pocketsmith.query_transactions service
+MAX_TRANSACTIONS_ATTRIBUTE = 20
 
 
 async def async_setup_entry(
@@ -74,44 +39,131 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up PocketSmith sensor based on a config entry."""
+    """Set up PocketSmith sensor based on a config entry.
+
+    Account and category entities follow the coordinator: after each
+    successful refresh entities are added for new accounts and top-level
+    categories, and removed for those that vanished (or accounts that became
+    inaccessible), without reloading the entry.
+    """
     coordinator: PocketSmithDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
+    # Entities created per transaction account and per top-level category,
+    # keyed by sensor kind
+    account_entities: dict[Any, dict[str, SensorEntity]] = {}
+    category_entities: dict[Any, dict[str, SensorEntity]] = {}
+
+    def _new_entities() -> list[SensorEntity]:
+        """Create the entities missing for the accounts and categories in the current view."""
+        entities: list[SensorEntity] = []
+        if not coordinator.data or "view" not in coordinator.data:
+            return entities
+        view = coordinator.data["view"]
+
+        for category_id in view.spending:
+            created = category_entities.setdefault(category_id, {})
+            for period in (PERIOD_MONTH, PERIOD_ROLLING):
+                if period not in created:
+                    created[period] = PocketSmithCategorySpendingSensor(
+                        coordinator=coordinator,
+                        category_id=category_id,
+                        period=period,
+                    )
+                    entities.append(created[period])
 
-    if coordinator.data and "transaction_accounts" in coordinator.data:
-        for ta_id, ta in coordinator.data["transaction_accounts"].items():
-            entities.append(
-                PocketSmithAccountBalanceSensor(
+        for ta_id, account in view.accounts.items():
+            created = account_entities.setdefault(ta_id, {})
+            if "balance" not in created:
+                created["balance"] = PocketSmithAccountBalanceSensor(
                     coordinator=coordinator,
                     account_id=ta_id,
                 )
-            )
+                entities.append(created["balance"])
 
-            entities.append(
-                PocketSmithTransactionHistorySensor(
+            if "transactions" not in created:
+                created["transactions"] = PocketSmithTransactionHistorySensor(
                     coordinator=coordinator,
                     ta_id=ta_id,
                 )
-            )
+                entities.append(created["transactions"])
 
             # Only create a feed status sensor for live feed accounts
-            if _is_feed_account(ta):
-                entities.append(
-                    PocketSmithFeedStatusSensor(
-                        coordinator=coordinator,
-                        ta_id=ta_id,
-                    )
+            if account.is_feed and "feed_status" not in created:
+                created["feed_status"] = PocketSmithFeedStatusSensor(
+                    coordinator=coordinator,
+                    ta_id=ta_id,
                 )
+                entities.append(created["feed_status"])
+
+        return entities
+
+    @callback
+    def _async_remove_entities(entities: Iterable[SensorEntity]) -> None:
+        """Remove entities, keeping their registry entries.
+
+        An account can be missing from one response or return 404 for a
+        while; when it comes back its entities reuse the registry entries,
+        keeping any names or areas the user set.
+        """
+        for entity in entities:
+            if entity.hass is not None:
+                hass.async_create_task(entity.async_remove())
+
+    @callback
+    def _async_sync_entities() -> None:
+        """Add entities for new accounts/categories and remove vanished ones."""
+        if not coordinator.last_update_success or not coordinator.data:
+            return
+        view = coordinator.data["view"]
+
+        if new_entities := _new_entities():
+            _LOGGER.info(
+                "Adding %d PocketSmith entities for new accounts or categories",
+                len(new_entities),
+            )
+            async_add_entities(new_entities)
 
+        for ta_id in set(account_entities) - view.accounts.keys():
+            _LOGGER.info(
+                "PocketSmith transaction account %s is no longer available, removing its entities",
+                ta_id,
+            )
+            _async_remove_entities(account_entities.pop(ta_id).values())
+
+        # Categories are only known once the tree has been fetched; keep their
+        # entities while it is unavailable
+        if view.spending:
+            for category_id in set(category_entities) - view.spending.keys():
+                _LOGGER.info(
+                    "PocketSmith category %s no longer exists, removing its entities",
+                    category_id,
+                )
+                _async_remove_entities(category_entities.pop(category_id).values())
+
+    entities = _new_entities()
     entities.append(PocketSmithUncategorizedSensor(coordinator=coordinator))
+    entities.append(PocketSmithNetWorthSensor(coordinator=coordinator))
+    entities.append(PocketSmithRefreshDurationSensor(coordinator=coordinator))
+
+    if coordinator.budget is not None:
+        for side in (BUDGET_EXPENSE, BUDGET_INCOME):
+            entities.append(
+                PocketSmithBudgetSensor(
+                    coordinator=coordinator.budget,
+                    side=side,
+                )
+            )
+        entities.append(PocketSmithForecastSensor(coordinator=coordinator.budget))
 
     async_add_entities(entities)
 
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_entities))
+
 
-class PocketSmithAccountBalanceSensor(CoordinatorEntity, SensorEntity):
+class PocketSmithAccountBalanceSensor(PocketSmithEntity, SensorEntity):
     """Sensor for PocketSmith account balance."""
 
+    _tiers = frozenset({TIER_BALANCES})
     _attr_has_entity_name = False
     _attr_state_class = SensorStateClass.TOTAL
 
@@ -124,18 +176,12 @@ class PocketSmithAccountBalanceSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.account_id = account_id
 
-        account = coordinator.data.get("transaction_accounts", {}).get(account_id, {})
-
-        institution_data = account.get("institution", {})
-        if isinstance(institution_data, dict):
-            institution = institution_data.get("title", "Unknown")
-        else:
-            institution = str(institution_data) if institution_data else "Unknown"
-
-        account_name = account.get("name", "Account {}".format(account_id))
+        account = self.view.account(account_id)
 
         self._attr_unique_id = "{}_{}_account_{}".format(DOMAIN, coordinator.username, account_id)
-        self._attr_name = "PocketSmith {} {} {}".format(coordinator.username, institution, account_name)
+        self._attr_name = "PocketSmith {} {} {}".format(
+            coordinator.username, account.institution_label, account.display_name
+        )
 
         self._attr_device_info = DeviceInfo(
             entry_type=DeviceEntryType.SERVICE,
@@ -147,69 +193,61 @@ class PocketSmithAccountBalanceSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor (current balance)."""
-        account = self.coordinator.data.get("transaction_accounts", {}).get(self.account_id)
+        account = self.view.account(self.account_id)
         if account:
-            return account.get("current_balance")
+            return account.raw.get("current_balance")
         return None
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement (currency)."""
-        account = self.coordinator.data.get("transaction_accounts", {}).get(self.account_id)
+        account = self.view.account(self.account_id)
         if account:
-            return account.get("currency_code")
+            return account.currency_code
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        account = self.coordinator.data.get("transaction_accounts", {}).get(self.account_id, {})
-
-        institution_data = account.get("institution", {})
-        if isinstance(institution_data, dict):
-            institution_name = institution_data.get("title")
-        else:
-            institution_name = str(institution_data) if institution_data else None
-
-        currency_code = account.get("currency_code")
-        currency_symbol = None
-        if currency_code:
-            currency_symbol = CURRENCY_SYMBOLS.get(currency_code.upper())
+        account = self.view.account(self.account_id)
+        if account is None:
+            return {}
+        raw = account.raw
 
         attributes = {
-            "current_balance": account.get("current_balance"),
-            "currency": currency_code,
-            "currency_symbol": currency_symbol,
-            "institution_name": institution_name,
-            "account_name": account.get("name"),
-            "last_updated": dt_util.now(),
+            "current_balance": raw.get("current_balance"),
+            "currency": account.currency_code,
+            "currency_symbol": account.currency_symbol,
+            "institution_name": account.institution_name,
+            "account_name": account.name,
+            "last_updated": raw.get("updated_at"),
         }
 
-        account_number = account.get("number")
+        account_number = raw.get("number")
         if account_number:
             attributes["account_number"] = account_number
 
         attributes.update({
-            "account_type": account.get("type"),
-            "current_balance_date": account.get("current_balance_date"),
-            "current_balance_exchange_rate": account.get("current_balance_exchange_rate"),
-            "safe_balance": account.get("safe_balance"),
-            "safe_balance_in_base_currency": account.get("safe_balance_in_base_currency"),
-            "starting_balance": account.get("starting_balance"),
-            "starting_balance_date": account.get("starting_balance_date"),
+            "account_type": raw.get("type"),
+            "current_balance_date": raw.get("current_balance_date"),
+            "current_balance_exchange_rate": raw.get("current_balance_exchange_rate"),
+            "safe_balance": raw.get("safe_balance"),
+            "safe_balance_in_base_currency": raw.get("safe_balance_in_base_currency"),
+            "starting_balance": raw.get("starting_balance"),
+            "starting_balance_date": raw.get("starting_balance_date"),
         })
 
         # Surface feed health on the balance sensor for dashboard convenience.
         # Only populated for live feed accounts; absent for offline accounts.
-        if _is_feed_account(account):
-            attributes["feed_name"] = account.get("latest_feed_name")
-            attributes["last_refreshed_at"] = account.get("updated_at")
-            attributes["feed_status"] = _derive_feed_status(account)
+        if account.is_feed:
+            attributes["feed_name"] = raw.get("latest_feed_name")
+            attributes["last_refreshed_at"] = raw.get("updated_at")
+            attributes["feed_status"] = account.feed_status
 
         return attributes
 
 
-class PocketSmithFeedStatusSensor(CoordinatorEntity, SensorEntity):
+class PocketSmithFeedStatusSensor(PocketSmithEntity, SensorEntity):
     """Dedicated sensor for the inferred feed health of a PocketSmith account.
 
     The PocketSmith API does not return a feed_status field. Status is derived
@@ -220,9 +258,10 @@ class PocketSmithFeedStatusSensor(CoordinatorEntity, SensorEntity):
       - 'unknown' — updated_at is missing or unparseable
 
     Attributes include last_refreshed_at (the raw updated_at value) and
-    hours_since_refresh (pre-calculated float) for use in automations.
+    hours_since_refresh (pre-calculated whole hours) for use in automations.
     """
 
+    _tiers = frozenset({TIER_BALANCES})
     _attr_has_entity_name = False
 
     def __init__(
@@ -234,19 +273,11 @@ class PocketSmithFeedStatusSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.ta_id = ta_id
 
-        ta = coordinator.data.get("transaction_accounts", {}).get(ta_id, {})
-
-        institution_data = ta.get("institution", {})
-        if isinstance(institution_data, dict):
-            institution = institution_data.get("title", "Unknown")
-        else:
-            institution = str(institution_data) if institution_data else "Unknown"
-
-        account_name = ta.get("name", "Account {}".format(ta_id))
+        account = self.view.account(ta_id)
 
         self._attr_unique_id = "{}_{}_feed_status_{}".format(DOMAIN, coordinator.username, ta_id)
         self._attr_name = "PocketSmith {} {} {} Feed Status".format(
-            coordinator.username, institution, account_name
+            coordinator.username, account.institution_label, account.display_name
         )
 
         self._attr_device_info = DeviceInfo(
@@ -259,8 +290,10 @@ class PocketSmithFeedStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the derived feed status: 'active', 'stale', or 'unknown'."""
-        ta = self.coordinator.data.get("transaction_accounts", {}).get(self.ta_id, {})
-        return _derive_feed_status(ta)
+        account = self.view.account(self.ta_id)
+        if account is None:
+            return "offline"
+        return account.feed_status
 
     @property
     def icon(self) -> str:
@@ -275,35 +308,36 @@ class PocketSmithFeedStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return feed-related attributes useful for automations."""
-        ta = self.coordinator.data.get("transaction_accounts", {}).get(self.ta_id, {})
-
-        institution_data = ta.get("institution", {})
-        if isinstance(institution_data, dict):
-            institution_name = institution_data.get("title")
-        else:
-            institution_name = str(institution_data) if institution_data else None
-
-        last_refreshed_at = ta.get("updated_at")
+        account = self.view.account(self.ta_id)
+        if account is None:
+            return {}
+        raw = account.raw
 
         return {
-            "feed_name": ta.get("latest_feed_name"),
-            "feed_status": _derive_feed_status(ta),
-            "last_refreshed_at": last_refreshed_at,
-            "hours_since_refresh": _hours_since(last_refreshed_at),
-            "current_balance_date": ta.get("current_balance_date"),
-            "data_feeds_connection_id": ta.get("data_feeds_connection_id"),
-            "account_name": ta.get("name"),
-            "institution_name": institution_name,
-            "account_type": ta.get("type"),
-            "last_updated": dt_util.now(),
+            "feed_name": raw.get("latest_feed_name"),
+            "feed_status": account.feed_status,
+            "last_refreshed_at": raw.get("updated_at"),
+            "hours_since_refresh": account.hours_since_refresh,
+            "current_balance_date": raw.get("current_balance_date"),
+            "data_feeds_connection_id": raw.get("data_feeds_connection_id"),
+            "account_name": account.name,
+            "institution_name": account.institution_name,
+            "account_type": raw.get("type"),
+            "last_updated": raw.get("updated_at"),
         }
 
 
-class PocketSmithTransactionHistorySensor(CoordinatorEntity, SensorEntity):
-    """Sensor for PocketSmith transaction history."""
+class PocketSmithTransactionHistorySensor(PocketSmithEntity, SensorEntity):
+    """Sensor for PocketSmith transaction history.
+
+    The transaction list is not recorded; the pocketsmith.query_transactions
+    service returns the full history on demand.
+    """
 
+    _tiers = frozenset({TIER_TRANSACTIONS})
     _attr_has_entity_name = False
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"transactions"})
 
     def __init__(
         self,
@@ -314,18 +348,12 @@ class PocketSmithTransactionHistorySensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.ta_id = ta_id
 
-        ta = coordinator.data.get("transaction_accounts", {}).get(ta_id, {})
-
-        institution_data = ta.get("institution", {})
-        if isinstance(institution_data, dict):
-            institution = institution_data.get("title", "Unknown")
-        else:
-            institution = str(institution_data) if institution_data else "Unknown"
-
-        account_name = ta.get("name", "Account {}".format(ta_id))
+        account = self.view.account(ta_id)
 
         self._attr_unique_id = "{}_{}_transactions_{}".format(DOMAIN, coordinator.username, ta_id)
-        self._attr_name = "PocketSmith {} {} {} Transactions".format(coordinator.username, institution, account_name)
+        self._attr_name = "PocketSmith {} {} {} Transactions".format(
+            coordinator.username, account.institution_label, account.display_name
+        )
 
         self._attr_device_info = DeviceInfo(
             entry_type=DeviceEntryType.SERVICE,
@@ -337,63 +365,58 @@ class PocketSmithTransactionHistorySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor (number of transactions)."""
-        transactions = self.coordinator.data.get("transactions", {}).get(self.ta_id, [])
-        return len(transactions)
+        account = self.view.account(self.ta_id)
+        if account is None:
+            return 0
+        return len(account.transactions)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes with last 20 transactions."""
-        transactions = self.coordinator.data.get("transactions", {}).get(self.ta_id, [])
-
-        ta = self.coordinator.data.get("transaction_accounts", {}).get(self.ta_id, {})
-
-        institution_data = ta.get("institution", {})
-        if isinstance(institution_data, dict):
-            institution_name = institution_data.get("title")
-        else:
-            institution_name = str(institution_data) if institution_data else None
-
-        currency_code = ta.get("currency_code")
-        currency_symbol = None
-        if currency_code:
-            currency_symbol = CURRENCY_SYMBOLS.get(currency_code.upper())
+        """Return the state attributes with the most recent transactions."""
+        account = self.view.account(self.ta_id)
+        if account is None:
+            return {}
 
         attributes = {
-            "account_name": ta.get("name"),
-            "institution_name": institution_name,
-            "currency": currency_code,
-            "currency_symbol": currency_symbol,
-            "transaction_count": len(transactions),
-            "last_updated": dt_util.now(),
+            "account_name": account.name,
+            "institution_name": account.institution_name,
+            "currency": account.currency_code,
+            "currency_symbol": account.currency_symbol,
+            "transaction_count": len(account.transactions),
+            "last_updated": account.transactions_updated_at,
+            "stale": account.transactions_stale,
             "transactions": [],
         }
+        if account.transactions_retry_at:
+            attributes["next_retry"] = account.transactions_retry_at
 
-        for transaction in transactions[:20]:
+        for transaction in account.transactions[:MAX_TRANSACTIONS_ATTRIBUTE]:
             transaction_data = {
-                "id": transaction.get("id"),
-                "amount": transaction.get("amount"),
-                "payee": transaction.get("payee"),
-                "date": transaction.get("date"),
+                "id": transaction.id,
+                "amount": transaction.amount,
+                "payee": transaction.payee,
+                "date": transaction.date,
             }
 
-            if transaction.get("memo"):
-                transaction_data["memo"] = transaction.get("memo")
+            if transaction.memo:
+                transaction_data["memo"] = transaction.memo
 
-            category = transaction.get("category")
-            if category and isinstance(category, dict) and category.get("title"):
-                transaction_data["category"] = category.get("title")
+            if transaction.category_title:
+                transaction_data["category"] = transaction.category_title
 
             attributes["transactions"].append(transaction_data)
 
         return attributes
 
 
-class PocketSmithUncategorizedSensor(CoordinatorEntity, SensorEntity):
+class PocketSmithUncategorizedSensor(PocketSmithEntity, SensorEntity):
     """Sensor for uncategorized transactions across all accounts."""
 
+    _tiers = frozenset({TIER_TRANSACTIONS})
     _attr_has_entity_name = False
     _attr_icon = "mdi:alert-circle-outline"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"by_account"})
 
     def __init__(
         self,
@@ -414,59 +437,384 @@ class PocketSmithUncategorizedSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the total number of uncategorized transactions."""
-        total_uncategorized = 0
-
-        transactions_by_account = self.coordinator.data.get("transactions", {})
-        for ta_id, transactions in transactions_by_account.items():
-            for transaction in transactions:
-                category = transaction.get("category")
-                if not category or (isinstance(category, dict) and not category.get("title")):
-                    total_uncategorized += 1
-
-        return total_uncategorized
+        return self.view.uncategorized_total
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return attributes with uncategorized count per account and transaction IDs."""
         attributes = {
-            "total_uncategorized": 0,
-            "last_updated": dt_util.now(),
+            "total_uncategorized": self.view.uncategorized_total,
+            "last_updated": self.view.transactions_updated_at,
             "by_account": {},
         }
 
-        transactions_by_account = self.coordinator.data.get("transactions", {})
-        transaction_accounts = self.coordinator.data.get("transaction_accounts", {})
-
-        for ta_id, transactions in transactions_by_account.items():
-            ta = transaction_accounts.get(ta_id, {})
-            account_name = ta.get("name", "account_{}".format(ta_id))
-
-            institution_data = ta.get("institution", {})
-            if isinstance(institution_data, dict):
-                institution = institution_data.get("title", "unknown")
-            else:
-                institution = str(institution_data) if institution_data else "unknown"
-
-            account_key = "{}_{}".format(institution, account_name)
-
-            uncategorized_count = 0
-            uncategorized_ids = []
-
-            for transaction in transactions:
-                category = transaction.get("category")
-                if not category or (isinstance(category, dict) and not category.get("title")):
-                    uncategorized_count += 1
-                    transaction_id = transaction.get("id")
-                    if transaction_id:
-                        uncategorized_ids.append(transaction_id)
-
-            if uncategorized_count > 0:
-                attributes["by_account"][account_key] = {
-                    "count": uncategorized_count,
-                    "institution": institution,
-                    "account_name": account_name,
-                    "transaction_ids": uncategorized_ids[:10],
-                }
-                attributes["total_uncategorized"] += uncategorized_count
+        for ta_id, account in self.view.accounts.items():
+            if not account.uncategorized_count:
+                continue
+            account_name = account.name or "account_{}".format(ta_id)
+            institution = account.institution_name or "unknown"
+            attributes["by_account"]["{}_{}".format(institution, account_name)] = {
+                "count": account.uncategorized_count,
+                "institution": institution,
+                "account_name": account_name,
+                "transaction_ids": list(account.uncategorized_ids[:10]),
+            }
+
+        return attributes
+
+
+class PocketSmithNetWorthSensor(PocketSmithEntity, SensorEntity):
+    """Sensor for net worth across all accounts in the user's base currency.
+
+    Foreign currency balances are converted with exchange rates taken from
+    the account payloads and cached for several hours. Positive balances
+    count as assets and negative balances as liabilities.
+    """
+
+    _tiers = frozenset({TIER_BALANCES})
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:scale-balance"
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(
+        self,
+        coordinator: PocketSmithDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the net worth sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = "{}_{}_net_worth".format(DOMAIN, coordinator.username)
+        self._attr_name = "PocketSmith {} Net Worth".format(coordinator.username)
+
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, coordinator.entry_id)},
+            name="PocketSmith",
+            manufacturer="PocketSmith",
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return assets minus liabilities."""
+        net_worth = self.view.net_worth
+        return net_worth.total if net_worth else None
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the user's base currency."""
+        net_worth = self.view.net_worth
+        return net_worth.currency if net_worth else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return assets, liabilities and the balances per currency."""
+        net_worth = self.view.net_worth
+        if net_worth is None:
+            return {}
+
+        attributes = {
+            "assets": net_worth.assets,
+            "liabilities": net_worth.liabilities,
+            "currency": net_worth.currency,
+            "account_count": net_worth.account_count,
+            "by_currency": dict(net_worth.by_currency),
+            "exchange_rates": dict(net_worth.exchange_rates),
+            "exchange_rates_updated_at": net_worth.rates_updated_at.isoformat()
+            if net_worth.rates_updated_at
+            else None,
+        }
+        if net_worth.unconverted_accounts:
+            attributes["unconverted_accounts"] = list(net_worth.unconverted_accounts)
+        return attributes
+
+
+class PocketSmithRefreshDurationSensor(PocketSmithEntity, SensorEntity):
+    """Diagnostic sensor reporting refresh and per-endpoint request timings.
+
+    The state is the duration of the last refresh. Attributes summarise the
+    recent refreshes and name the slowest endpoint by p95 latency; the full
+    per-endpoint breakdown is kept out of the recorder.
+    """
+
+    _tiers = frozenset({TIER_BALANCES})
+    _attr_has_entity_name = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+    _unrecorded_attributes = frozenset({"endpoints"})
+
+    def __init__(
+        self,
+        coordinator: PocketSmithDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the refresh duration sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = "{}_{}_refresh_duration".format(DOMAIN, coordinator.username)
+        self._attr_name = "PocketSmith {} Refresh Duration".format(coordinator.username)
+
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, coordinator.entry_id)},
+            name="PocketSmith",
+            manufacturer="PocketSmith",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while refreshes fail so the timings remain visible."""
+        return self.coordinator.telemetry.refreshes > 0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the timings after every refresh, including failed ones."""
+        self.async_write_ha_state()
 
+    @property
+    def native_value(self) -> StateType:
+        """Return the duration of the last refresh in milliseconds."""
+        return self.coordinator.telemetry.summary()["last_refresh_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return refresh statistics and per-endpoint latency, bytes and statuses."""
+        telemetry = self.coordinator.telemetry
+        attributes = telemetry.as_dict()
+        del attributes["last_refresh_ms"]
+
+        slowest = telemetry.slowest_endpoint()
+        attributes["slowest_endpoint"] = slowest[0] if slowest else None
+        attributes["slowest_endpoint_p95_ms"] = (
+            round(slowest[1] * 1000, 1) if slowest else None
+        )
         return attributes
+
+
+class PocketSmithCategorySpendingSensor(PocketSmithEntity, SensorEntity):
+    """Sensor for spending in one top-level category over a period.
+
+    Subcategories roll up into their top-level category. The totals are
+    computed from the transactions the integration holds (the most recent
+    transactions_per_account per account); the complete attribute is False
+    when older transactions needed for the period are not held.
+    """
+
+    _tiers = frozenset({TIER_METADATA, TIER_TRANSACTIONS})
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:chart-pie"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    _PERIOD_NAMES = {
+        PERIOD_MONTH: ("month", "Spending This Month"),
+        PERIOD_ROLLING: ("30d", "Spending Last 30 Days"),
+    }
+
+    def __init__(
+        self,
+        coordinator: PocketSmithDataUpdateCoordinator,
+        category_id: Any,
+        period: str,
+    ) -> None:
+        """Initialize the category spending sensor."""
+        super().__init__(coordinator)
+        self.category_id = category_id
+        self.period = period
+
+        category = self.view.spending[category_id]
+        suffix, label = self._PERIOD_NAMES[period]
+
+        self._attr_unique_id = "{}_{}_category_{}_spending_{}".format(
+            DOMAIN, coordinator.username, category_id, suffix
+        )
+        self._attr_name = "PocketSmith {} {} {}".format(
+            coordinator.username, category.title, label
+        )
+
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, coordinator.entry_id)},
+            name="PocketSmith",
+            manufacturer="PocketSmith",
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the amount spent, net of refunds, in the base currency."""
+        category = self.view.spending.get(self.category_id)
+        if category is None:
+            return None
+        return round(category.periods[self.period].spent, 2)
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the user's base currency."""
+        return self.coordinator.data["user"].get("base_currency_code")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the period, totals and the spending per subcategory."""
+        category = self.view.spending.get(self.category_id)
+        if category is None:
+            return {}
+        spend = category.periods[self.period]
+
+        return {
+            "category_id": category.category_id,
+            "category_name": category.title,
+            "period": self.period,
+            "start_date": spend.start.isoformat(),
+            "end_date": spend.end.isoformat(),
+            "debits": round(spend.debits, 2),
+            "credits": round(spend.credits, 2),
+            "transaction_count": spend.transaction_count,
+            "by_subcategory": {
+                title: round(amount, 2) for title, amount in spend.by_subcategory.items()
+            },
+            "complete": spend.complete,
+            "last_updated": self.view.transactions_updated_at,
+        }
+
+
+class PocketSmithBudgetSensor(PocketSmithBudgetEntity, SensorEntity):
+    """Sensor for this month's budgeted expenses or income.
+
+    The state is the actual amount so far; attributes carry the budgeted
+    and forecast amounts from PocketSmith's budget summary.
+    """
+
+    _attr_has_entity_name = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    _SIDE_NAMES = {
+        BUDGET_EXPENSE: ("expenses", "Budget Expenses This Month", "mdi:cash-minus"),
+        BUDGET_INCOME: ("income", "Budget Income This Month", "mdi:cash-plus"),
+    }
+
+    def __init__(
+        self,
+        coordinator: PocketSmithBudgetCoordinator,
+        side: str,
+    ) -> None:
+        """Initialize the budget sensor."""
+        super().__init__(coordinator)
+        self.side = side
+        username = coordinator.client.username
+        suffix, label, icon = self._SIDE_NAMES[side]
+
+        self._attr_unique_id = "{}_{}_budget_{}".format(DOMAIN, username, suffix)
+        self._attr_name = "PocketSmith {} {}".format(username, label)
+        self._attr_icon = icon
+
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, coordinator.client.entry_id)},
+            name="PocketSmith",
+            manufacturer="PocketSmith",
+        )
+
+    @property
+    def _period(self) -> Any:
+        """Return the budget figures for this sensor's side, if fetched."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self.side)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the actual amount so far this month."""
+        period = self._period
+        return period.actual if period else None
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the budget currency."""
+        period = self._period
+        return period.currency_code if period else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the budgeted and forecast amounts for the month."""
+        period = self._period
+        if period is None:
+            return {}
+        fetched_at = self.coordinator.fetched_at
+
+        return {
+            "budgeted": period.budgeted,
+            "forecast": period.forecast,
+            "refunds": period.refunds,
+            "over_budget": period.over_budget,
+            "over_by": period.over_by,
+            "under_by": period.under_by,
+            "percentage_used": period.percentage_used,
+            "start_date": period.start_date,
+            "end_date": period.end_date,
+            "currency": period.currency_code,
+            "last_updated": fetched_at.isoformat() if fetched_at else None,
+        }
+
+
+class PocketSmithForecastSensor(PocketSmithBudgetEntity, SensorEntity):
+    """Sensor for this month's forecast net cash flow (income less expenses)."""
+
+    _attr_has_entity_name = False
+    _attr_icon = "mdi:crystal-ball"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: PocketSmithBudgetCoordinator,
+    ) -> None:
+        """Initialize the forecast sensor."""
+        super().__init__(coordinator)
+        username = coordinator.client.username
+
+        self._attr_unique_id = "{}_{}_forecast_net".format(DOMAIN, username)
+        self._attr_name = "PocketSmith {} Forecast Net This Month".format(username)
+
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, coordinator.client.entry_id)},
+            name="PocketSmith",
+            manufacturer="PocketSmith",
+        )
+
+    def _forecasts(self) -> tuple[Any, Any]:
+        """Return the (income, expense) budget figures, if fetched."""
+        data = self.coordinator.data or {}
+        return data.get(BUDGET_INCOME), data.get(BUDGET_EXPENSE)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return forecast income minus forecast expenses."""
+        income, expense = self._forecasts()
+        if income is None and expense is None:
+            return None
+        income_forecast = (income.forecast if income else None) or 0.0
+        expense_forecast = (expense.forecast if expense else None) or 0.0
+        return round(income_forecast - expense_forecast, 2)
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the budget currency."""
+        income, expense = self._forecasts()
+        period = expense or income
+        return period.currency_code if period else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the forecast and budgeted income and expenses."""
+        income, expense = self._forecasts()
+        if income is None and expense is None:
+            return {}
+        fetched_at = self.coordinator.fetched_at
+
+        return {
+            "forecast_income": income.forecast if income else None,
+            "forecast_expenses": expense.forecast if expense else None,
+            "budgeted_income": income.budgeted if income else None,
+            "budgeted_expenses": expense.budgeted if expense else None,
+            "start_date": (expense or income).start_date,
+            "end_date": (expense or income).end_date,
+            "last_updated": fetched_at.isoformat() if fetched_at else None,
+        }
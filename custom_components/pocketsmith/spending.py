@@ -0,0 +1,274 @@
+"""Per-category spending aggregated from the locally held transactions."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+
+from .models import Transaction
+
+# Length of the rolling spending window, including today
+ROLLING_WINDOW_DAYS = 30
+
+# Keys of the per-category rollup periods
+PERIOD_MONTH = "month"
+PERIOD_ROLLING = "rolling_30d"
+
+
+def flatten_categories(tree: Iterable[Mapping[str, Any]]) -> dict[Any, dict[str, Any]]:
+    """Flatten the nested category tree returned by the API.
+
+    Returns {id: {"id", "title", "parent_id", "is_transfer"}}, which is small
+    enough to keep in the snapshot.
+    """
+    categories: dict[Any, dict[str, Any]] = {}
+    stack = [(category, None) for category in tree]
+    while stack:
+        category, parent_id = stack.pop()
+        category_id = category.get("id")
+        if category_id is None:
+            continue
+        categories[category_id] = {
+            "id": category_id,
+            "title": category.get("title"),
+            "parent_id": category.get("parent_id", parent_id),
+            "is_transfer": bool(category.get("is_transfer")),
+        }
+        stack.extend((child, category_id) for child in category.get("children") or ())
+    return categories
+
+
+class CategoryTree:
+    """Category titles and the top-level ancestor of every category."""
+
+    def __init__(self, categories: Mapping[Any, Mapping[str, Any]]) -> None:
+        """Index a flattened category mapping."""
+        self.categories = categories
+        self.roots: dict[Any, Any] = {}
+        for category_id in categories:
+            self.roots[category_id] = self._find_root(category_id)
+
+    def _find_root(self, category_id: Any) -> Any:
+        """Walk up the parents of a category, guarding against cycles."""
+        seen = set()
+        while category_id not in seen:
+            seen.add(category_id)
+            parent_id = self.categories[category_id].get("parent_id")
+            if parent_id is None or parent_id not in self.categories:
+                return category_id
+            category_id = parent_id
+        return category_id
+
+    def with_descendants(self, category_ids: Iterable[Any]) -> set[Any]:
+        """Return the given categories together with all their subcategories."""
+        selected = set(category_ids)
+        result = set(selected)
+        for category_id in self.categories:
+            parent_id = self.categories[category_id].get("parent_id")
+            seen = {category_id}
+            while parent_id is not None and parent_id not in seen:
+                if parent_id in selected:
+                    result.add(category_id)
+                    break
+                seen.add(parent_id)
+                parent = self.categories.get(parent_id)
+                parent_id = parent.get("parent_id") if parent else None
+        return result
+
+    def title(self, category_id: Any) -> str | None:
+        """Return the title of a category."""
+        category = self.categories.get(category_id)
+        return category.get("title") if category else None
+
+    def top_level(self) -> list[Any]:
+        """Return the ids of the top-level categories that are not transfers."""
+        return [
+            category_id
+            for category_id, root_id in self.roots.items()
+            if category_id == root_id and not self.categories[category_id]["is_transfer"]
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodSpend:
+    """Spending in one top-level category over one period.
+
+    Amounts are in the user's base currency; spent is debits net of
+    credits (refunds), so spending is positive.
+    """
+
+    start: date
+    end: date
+    spent: float
+    debits: float
+    credits: float
+    transaction_count: int
+    by_subcategory: Mapping[str, float]
+    complete: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CategorySpending:
+    """Current-month and rolling spending for one top-level category."""
+
+    category_id: Any
+    title: str
+    periods: Mapping[str, PeriodSpend]
+
+
+class _Bucket:
+    """Running totals, in cents, for one category on one day."""
+
+    __slots__ = ("debits", "credits", "count")
+
+    def __init__(self) -> None:
+        """Initialize an empty bucket."""
+        self.debits = 0
+        self.credits = 0
+        self.count = 0
+
+
+def _contribution(transaction: Transaction) -> tuple[Any, str, int] | None:
+    """Return (category_id, date, cents) for a transaction that counts as spending."""
+    if transaction.category_id is None or not transaction.date:
+        return None
+    amount = transaction.amount_in_base_currency
+    if amount is None:
+        amount = transaction.amount
+    if amount is None:
+        return None
+    return transaction.category_id, transaction.date[:10], round(amount * 100)
+
+
+class SpendingAggregator:
+    """Per-category, per-day totals maintained incrementally.
+
+    Each account's transaction list is diffed against what it contributed
+    last time, so only new, changed or dropped transactions touch the
+    totals. Buckets are keyed by the transaction's own category; rolling up
+    into top-level categories happens when a summary is built, so a new
+    category tree does not require re-aggregating.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self._buckets: dict[tuple[Any, str], _Bucket] = {}
+        # What each account's transactions contributed, by transaction id
+        self._contributions: dict[Any, dict[Any, tuple[Any, str, int]]] = {}
+        self._sources: dict[Any, list[Transaction]] = {}
+        self._version = 0
+        self._summary_key: tuple[Any, ...] | None = None
+        self._summary: Mapping[Any, CategorySpending] = MappingProxyType({})
+
+    def _apply(self, contribution: tuple[Any, str, int], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one transaction from the buckets."""
+        category_id, day, cents = contribution
+        key = (category_id, day)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+        if cents < 0:
+            bucket.debits -= sign * cents
+        else:
+            bucket.credits += sign * cents
+        bucket.count += sign
+        if bucket.count <= 0:
+            del self._buckets[key]
+
+    def update(self, transactions_by_account: Mapping[Any, list[Transaction]]) -> None:
+        """Bring the totals in line with the accounts' current transactions."""
+        for ta_id in set(self._contributions) - set(transactions_by_account):
+            for contribution in self._contributions.pop(ta_id).values():
+                self._apply(contribution, -1)
+            self._sources.pop(ta_id, None)
+            self._version += 1
+
+        for ta_id, transactions in transactions_by_account.items():
+            # Carried-forward lists are the same object as last time
+            if self._sources.get(ta_id) is transactions:
+                continue
+            self._sources[ta_id] = transactions
+            previous = self._contributions.get(ta_id, {})
+            current = {}
+            for transaction in transactions:
+                if (contribution := _contribution(transaction)) is not None:
+                    current[transaction.id] = contribution
+
+            for transaction_id, contribution in previous.items():
+                if current.get(transaction_id) != contribution:
+                    self._apply(contribution, -1)
+                    self._version += 1
+            for transaction_id, contribution in current.items():
+                if previous.get(transaction_id) != contribution:
+                    self._apply(contribution, 1)
+                    self._version += 1
+            self._contributions[ta_id] = current
+
+    def summary(
+        self, tree: CategoryTree, today: date, coverage_start: date | None
+    ) -> Mapping[Any, CategorySpending]:
+        """Return spending per top-level category for the month and rolling window.
+
+        coverage_start is the earliest date from which every account's
+        transactions are held; periods starting before it are marked
+        incomplete. The result is cached until the totals, tree or date change.
+        """
+        key = (self._version, id(tree), today, coverage_start)
+        if key == self._summary_key:
+            return self._summary
+
+        starts = {
+            PERIOD_MONTH: today.replace(day=1),
+            PERIOD_ROLLING: today - timedelta(days=ROLLING_WINDOW_DAYS - 1),
+        }
+        bounds = {period: (start.isoformat(), today.isoformat()) for period, start in starts.items()}
+        # {period: {root_id: [debits, credits, count, {category_id: cents}]}}
+        totals: dict[str, dict[Any, list[Any]]] = {period: {} for period in starts}
+
+        for (category_id, day), bucket in self._buckets.items():
+            root_id = tree.roots.get(category_id)
+            if root_id is None:
+                continue
+            for period, (start, end) in bounds.items():
+                if not start <= day <= end:
+                    continue
+                total = totals[period].get(root_id)
+                if total is None:
+                    total = totals[period][root_id] = [0, 0, 0, {}]
+                total[0] += bucket.debits
+                total[1] += bucket.credits
+                total[2] += bucket.count
+                total[3][category_id] = (
+                    total[3].get(category_id, 0) + bucket.debits - bucket.credits
+                )
+
+        summary = {}
+        for root_id in tree.top_level():
+            periods = {}
+            for period, start in starts.items():
+                debits, credits, count, by_category = totals[period].get(root_id, (0, 0, 0, {}))
+                periods[period] = PeriodSpend(
+                    start=start,
+                    end=today,
+                    spent=(debits - credits) / 100,
+                    debits=debits / 100,
+                    credits=credits / 100,
+                    transaction_count=count,
+                    by_subcategory=MappingProxyType(
+                        {
+                            tree.title(category_id) or str(category_id): cents / 100
+                            for category_id, cents in sorted(by_category.items(), key=lambda item: -item[1])
+                        }
+                    ),
+                    complete=coverage_start is None or coverage_start <= start,
+                )
+            summary[root_id] = CategorySpending(
+                category_id=root_id,
+                title=tree.title(root_id) or str(root_id),
+                periods=MappingProxyType(periods),
+            )
+
+        self._summary_key = key
+        self._summary = MappingProxyType(summary)
+        return self._summary
@@ -0,0 +1,127 @@
+"""Request and refresh timings for the PocketSmith coordinator."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from typing import Any
+
+# Number of recent samples kept per endpoint (and for refreshes) when
+# computing percentiles
+LATENCY_SAMPLES = 100
+
+
+def _percentile(samples: deque[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of the samples, or None if empty."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(index)]
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class EndpointStats:
+    """Counters and recent latencies for one endpoint path."""
+
+    __slots__ = ("requests", "bytes", "statuses", "latencies")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.requests = 0
+        self.bytes = 0
+        self.statuses: Counter[str] = Counter()
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "statuses": dict(sorted(self.statuses.items())),
+            "p50_ms": _ms(_percentile(self.latencies, 50)),
+            "p95_ms": _ms(_percentile(self.latencies, 95)),
+        }
+
+
+class Telemetry:
+    """Per-endpoint request statistics and refresh durations.
+
+    Endpoints are keyed by path without the query string, so each
+    transaction account's transactions endpoint is tracked separately.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.refresh_durations: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.last_refresh_duration: float | None = None
+        self.last_refresh_success: bool | None = None
+        self.refreshes = 0
+        self.failed_refreshes = 0
+
+    def _endpoint(self, endpoint: str) -> EndpointStats:
+        """Return the statistics for an endpoint, creating them if needed."""
+        path = endpoint.partition("?")[0]
+        stats = self.endpoints.get(path)
+        if stats is None:
+            stats = self.endpoints[path] = EndpointStats()
+        return stats
+
+    def record_request(self, endpoint: str, status: int | None, latency: float) -> None:
+        """Record one request; status is None when no response was received."""
+        stats = self._endpoint(endpoint)
+        stats.requests += 1
+        stats.statuses[str(status) if status is not None else "error"] += 1
+        stats.latencies.append(latency)
+
+    def record_bytes(self, endpoint: str, size: int) -> None:
+        """Record the size of a decoded response body."""
+        self._endpoint(endpoint).bytes += size
+
+    def record_refresh(self, duration: float, success: bool) -> None:
+        """Record one coordinator refresh."""
+        self.refreshes += 1
+        if not success:
+            self.failed_refreshes += 1
+        self.last_refresh_duration = duration
+        self.last_refresh_success = success
+        self.refresh_durations.append(duration)
+
+    def forget(self, endpoints: set[str]) -> None:
+        """Drop the statistics for endpoint paths that are no longer polled."""
+        for path in endpoints:
+            self.endpoints.pop(path, None)
+
+    def slowest_endpoint(self) -> tuple[str, float] | None:
+        """Return (path, p95 seconds) of the endpoint with the highest p95."""
+        slowest = None
+        for path, stats in self.endpoints.items():
+            p95 = _percentile(stats.latencies, 95)
+            if p95 is not None and (slowest is None or p95 > slowest[1]):
+                slowest = (path, p95)
+        return slowest
+
+    def summary(self) -> dict[str, Any]:
+        """Return the refresh-level figures."""
+        return {
+            "refreshes": self.refreshes,
+            "failed_refreshes": self.failed_refreshes,
+            "last_refresh_success": self.last_refresh_success,
+            "last_refresh_ms": _ms(self.last_refresh_duration),
+            "refresh_p50_ms": _ms(_percentile(self.refresh_durations, 50)),
+            "refresh_p95_ms": _ms(_percentile(self.refresh_durations, 95)),
+            "requests": sum(stats.requests for stats in self.endpoints.values()),
+            "bytes": sum(stats.bytes for stats in self.endpoints.values()),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary including every endpoint."""
+        return {
+            **self.summary(),
+            "endpoints": {
+                path: stats.as_dict() for path, stats in sorted(self.endpoints.items())
+            },
+        }
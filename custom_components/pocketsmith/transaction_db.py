@@ -0,0 +1,221 @@
+"""Local SQLite store of synced PocketSmith transactions.
+
+The coordinator only keeps the most recent transactions per account in
+memory. Every synced transaction is also written here, so history builds up
+over time and can be queried without calling the API. All methods block and
+must be run in the executor.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable
+
+from .models import Transaction
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Upper bound on rows returned by one query
+MAX_QUERY_LIMIT = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    account_id INTEGER NOT NULL,
+    date TEXT,
+    payee TEXT,
+    memo TEXT,
+    amount REAL,
+    amount_in_base_currency REAL,
+    category_id INTEGER,
+    category_title TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date ON transactions (account_id, date);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date);
+CREATE INDEX IF NOT EXISTS idx_transactions_payee ON transactions (payee COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions (category_id, date);
+"""
+
+_COLUMNS = (
+    "id",
+    "account_id",
+    "date",
+    "payee",
+    "memo",
+    "amount",
+    "amount_in_base_currency",
+    "category_id",
+    "category_title",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionQuery:
+    """Filters for TransactionDatabase.query(); None means unfiltered."""
+
+    account_ids: tuple[Any, ...] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    payee: str | None = None
+    min_amount: float | None = None
+    max_amount: float | None = None
+    category: str | None = None
+    category_ids: tuple[Any, ...] | None = None
+    uncategorized: bool = False
+    limit: int = 100
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards in a user-supplied substring."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _row(transaction: Transaction, account_id: Any) -> tuple[Any, ...]:
+    """Return the column values for a transaction."""
+    return (
+        transaction.id,
+        account_id,
+        transaction.date,
+        transaction.payee,
+        transaction.memo,
+        transaction.amount,
+        transaction.amount_in_base_currency,
+        transaction.category_id,
+        transaction.category_title,
+        transaction.updated_at,
+    )
+
+
+class TransactionDatabase:
+    """SQLite database of one config entry's transactions."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize; the database is opened on first use."""
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        # One connection is shared by executor threads
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self._connection is None:
+            # .storage may not exist yet on a fresh configuration directory
+            if directory := os.path.dirname(self.path):
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                connection.executescript(_SCHEMA)
+                connection.execute("PRAGMA user_version = {}".format(SCHEMA_VERSION))
+            self._connection = connection
+        return self._connection
+
+    def store(self, updates: Iterable[tuple[Any, list[Transaction], bool]]) -> None:
+        """Write synced transactions in one transaction.
+
+        updates holds (account_id, transactions, replaced). When replaced is
+        True the transactions are the account's full recent window, so rows
+        dated after its oldest transaction that are no longer returned were
+        deleted in PocketSmith and are removed here too. The oldest day itself
+        may be cut off by the window and is left alone.
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for account_id, transactions, replaced in updates:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO transactions ({}) VALUES ({})".format(
+                            ", ".join(_COLUMNS), ", ".join("?" * len(_COLUMNS))
+                        ),
+                        (_row(transaction, account_id) for transaction in transactions),
+                    )
+                    dates = [t.date for t in transactions if t.date]
+                    if replaced and dates:
+                        ids = [t.id for t in transactions]
+                        connection.execute(
+                            "DELETE FROM transactions WHERE account_id = ? AND date > ? "
+                            "AND id NOT IN ({})".format(", ".join("?" * len(ids))),
+                            (account_id, min(dates), *ids),
+                        )
+
+    def query(self, query: TransactionQuery) -> list[dict[str, Any]]:
+        """Return matching transactions, newest first."""
+        clauses = []
+        params: list[Any] = []
+        if query.account_ids:
+            clauses.append("account_id IN ({})".format(", ".join("?" * len(query.account_ids))))
+            params.extend(query.account_ids)
+        if query.start_date:
+            clauses.append("date >= ?")
+            params.append(query.start_date)
+        if query.end_date:
+            clauses.append("date <= ?")
+            params.append(query.end_date)
+        if query.payee:
+            clauses.append("payee LIKE ? ESCAPE '\\'")
+            params.append("%{}%".format(_escape_like(query.payee)))
+        if query.min_amount is not None:
+            clauses.append("amount >= ?")
+            params.append(query.min_amount)
+        if query.max_amount is not None:
+            clauses.append("amount <= ?")
+            params.append(query.max_amount)
+        if query.category:
+            clauses.append("category_title = ? COLLATE NOCASE")
+            params.append(query.category)
+        if query.category_ids:
+            clauses.append("category_id IN ({})".format(", ".join("?" * len(query.category_ids))))
+            params.extend(query.category_ids)
+        if query.uncategorized:
+            # Same rule as Transaction.is_uncategorized
+            clauses.append("(category_title IS NULL OR category_title = '')")
+
+        sql = "SELECT {} FROM transactions".format(", ".join(_COLUMNS))
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date DESC, id DESC LIMIT ?"
+        params.append(max(1, min(query.limit, MAX_QUERY_LIMIT)))
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def get(self, account_id: Any, ids: Iterable[Any]) -> dict[Any, Transaction]:
+        """Return the stored versions of an account's transactions by id."""
+        ids = list(ids)
+        if not ids:
+            return {}
+        sql = "SELECT {} FROM transactions WHERE account_id = ? AND id IN ({})".format(
+            ", ".join(_COLUMNS), ", ".join("?" * len(ids))
+        )
+        with self._lock:
+            rows = self._connect().execute(sql, (account_id, *ids)).fetchall()
+        return {row["id"]: Transaction.from_dict(dict(row)) for row in rows}
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def remove(self) -> None:
+        """Close and delete the database files."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                _LOGGER.warning("Unable to remove %s: %s", self.path + suffix, err)